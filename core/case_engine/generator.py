@@ -1,18 +1,29 @@
 """BDD test case generator (integrates SmartCaseAI logic)."""
 
 import re
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from pathlib import Path
 
-# External library import (required dependency)
-try:
-    from phoenix_smartcaseai import StoryBDDGenerator  # type: ignore
-except ImportError:
-    StoryBDDGenerator = None
-
 from core.utils.models import BDDStep, BDDScenario, BDDFeature, StepType
 
 
+# Quoted strings and element names after common keywords, each compiled
+# once. They are scanned in separate passes: their matches overlap, and
+# in a single alternation a keyword branch could consume the opening
+# quote of a quoted value.
+_TOKEN_PATTERNS = (
+    re.compile(r'"([^"]+)"'),
+    re.compile(r'enter\s+["\']?(\w+)["\']?', re.IGNORECASE),
+    re.compile(r'click\s+(?:on\s+)?["\']?(\w+)["\']?', re.IGNORECASE),
+    re.compile(r'select\s+["\']?(\w+)["\']?', re.IGNORECASE),
+    re.compile(r'fill\s+["\']?(\w+)["\']?', re.IGNORECASE),
+    re.compile(r'type\s+(?:in\s+)?["\']?(\w+)["\']?', re.IGNORECASE),
+)
+
+_STEP_PREFIXES = tuple(st.value for st in StepType)
+_STEP_TYPE_BY_PREFIX = {st.value: st for st in StepType}
+
+
 class BDDGenerator:
     """Generator for BDD test cases from user stories."""
     
@@ -29,10 +40,9 @@ class BDDGenerator:
         Returns:
             BDDFeature object
         """
+        # Iterate the file lazily instead of reading it into one string
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        return self.parse_feature_content(content)
+            return self._parse_lines(f)
     
     def parse_feature_content(self, content: str) -> BDDFeature:
         """Parse feature file content.
@@ -43,47 +53,63 @@ class BDDGenerator:
         Returns:
             BDDFeature object
         """
-        lines = content.split('\n')
+        return self._parse_lines(content.splitlines())
+    
+    def _parse_lines(self, lines: Iterable[str]) -> BDDFeature:
+        """Parse feature file lines.
+        
+        Args:
+            lines: Any iterable of feature file lines (list, open file, etc.)
+            
+        Returns:
+            BDDFeature object
+        """
         feature = BDDFeature(feature_name="", description="")
         current_scenario = None
         tags = []
         
-        for line in lines:
-            line = line.strip()
+        for raw in lines:
+            # Skip blank lines without allocating a stripped copy; lines
+            # read from a file keep their newline, so test for whitespace
+            if not raw or raw.isspace():
+                continue
             
-            if not line or line.startswith('#'):
+            line = raw.strip()
+            
+            # Dispatch on the first character so step lines (the common
+            # case) skip every header probe
+            first = line[0]
+            
+            # Skip comments
+            if first == '#':
                 continue
             
             # Parse tags
-            if line.startswith('@'):
+            if first == '@':
                 tags = [tag.strip('@') for tag in line.split()]
-                continue
             
             # Parse Feature
-            if line.startswith('Feature:'):
+            elif first == 'F' and line.startswith('Feature:'):
                 feature.feature_name = line.replace('Feature:', '').strip()
                 feature.tags = tags.copy()
                 tags = []
-                continue
             
             # Parse Scenario
-            if line.startswith('Scenario:') or line.startswith('Scenario Outline:'):
+            elif first == 'S' and line.startswith(('Scenario:', 'Scenario Outline:')):
                 if current_scenario:
                     feature.scenarios.append(current_scenario)
                 scenario_name = line.replace('Scenario:', '').replace('Scenario Outline:', '').strip()
                 current_scenario = BDDScenario(name=scenario_name, tags=tags.copy())
                 tags = []
-                continue
             
             # Parse Background
-            if line.startswith('Background:'):
+            elif first == 'B' and line.startswith('Background:'):
                 if current_scenario:
                     feature.scenarios.append(current_scenario)
                 current_scenario = BDDScenario(name="Background", tags=[])
-                continue
             
             # Parse Steps
-            if current_scenario:
+            elif current_scenario:
                 step = self._parse_step(line)
                 if step:
                     current_scenario.steps.append(step)
@@ -103,20 +129,18 @@ class BDDGenerator:
             BDDStep object or None
         """
         line = line.strip()
-        if not line:
+        
+        # Reject non-step lines with a single startswith call
+        if not line.startswith(_STEP_PREFIXES):
             return None
         
         # Determine step type
-        step_type = None
-        for st in StepType:
-            if line.startswith(st.value):
-                step_type = st
-                text = line[len(st.value):].strip()
+        for prefix in _STEP_PREFIXES:
+            if line.startswith(prefix):
+                step_type = _STEP_TYPE_BY_PREFIX[prefix]
+                text = line[len(prefix):].lstrip()
                 break
         
-        if not step_type:
-            return None
-        
         # Extract tokens (quoted strings, element names, etc.)
         tokens = self._extract_tokens(text)
         
@@ -140,29 +164,10 @@ class BDDGenerator:
         Returns:
             List of extracted tokens
         """
-        tokens = []
-        
-        # Extract quoted strings
-        quoted = re.findall(r'"([^"]+)"', text)
-        tokens.extend(quoted)
-        
-        # Extract element names after common keywords
-        patterns = [
-            r'enter\s+["\']?(\w+)["\']?',
-            r'click\s+(?:on\s+)?["\']?(\w+)["\']?',
-            r'select\s+["\']?(\w+)["\']?',
-            r'fill\s+["\']?(\w+)["\']?',
-            r'type\s+(?:in\s+)?["\']?(\w+)["\']?',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            tokens.extend(matches)
-        
-        # Remove duplicates and normalize
-        tokens = list(set([t.lower() for t in tokens if t]))
+        tokens = [token for pattern in _TOKEN_PATTERNS for token in pattern.findall(text)]
         
-        return tokens
+        # Remove duplicates and normalize, preserving order of extraction
+        return list(dict.fromkeys(t.lower() for t in tokens if t))
     
     def generate_from_story(self, user_story: str, num_cases: int = 5, llm_provider: str = "openai", context_files: Optional[List[str]] = None) -> BDDFeature:
         """Generate BDD feature from user story using SmartCaseAI.
@@ -182,12 +187,15 @@ class BDDGenerator:
         Raises:
             ImportError: If SmartCaseAI is not installed
         """
-        # Use SmartCaseAI directly - it's required
-        if StoryBDDGenerator is None:
+        # Use SmartCaseAI directly - it's required. Imported lazily so that
+        # parsing existing feature files never loads the LLM stack
+        try:
+            from phoenix_smartcaseai import StoryBDDGenerator  # type: ignore
+        except ImportError as e:
             raise ImportError(
                 "phoenix-smartcaseai package not found. Please install it: "
                 "pip install phoenix-smartcaseai"
-            )
+            ) from e
         
         generator = StoryBDDGenerator(llm_provider=llm_provider)
         feature_content = generator.generate_test_cases(
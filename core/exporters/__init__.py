@@ -1,5 +1,5 @@
 """Exporters for generating output files."""
 
-from .exporter import OutputExporter
+from .exporter import OutputExporter, write_json
 
-__all__ = ["OutputExporter"]
+__all__ = ["OutputExporter", "write_json"]
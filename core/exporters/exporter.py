@@ -1,9 +1,41 @@
 """Exporter for generating output files."""
 
 import json
+import re
 from pathlib import Path
-from typing import Optional
-from core.utils.models import BDDFeature, FusionReport, LocatorType
+from typing import Any, Dict, Iterator, Optional
+
+# Optional fast JSON encoder
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+from core.utils.models import BDDFeature, FusionReport, LocatorType, StepType
+
+
+# Filename sanitization patterns
+_NONWORD_RE = re.compile(r'[^\w\s-]')
+_COLLAPSE_RE = re.compile(r'[-\s]+')
+
+# Gherkin keyword per step type; a dict lookup is cheaper than the enum's
+# ``.value`` descriptor once per exported step
+_STEP_KEYWORDS = {step_type: step_type.value for step_type in StepType}
+
+
+def write_json(data: Any, output_path: Path) -> None:
+    """Write data as indented JSON in a single write.
+    
+    Uses orjson when it is installed, otherwise the stdlib encoder.
+    
+    Args:
+        data: JSON-serializable data
+        output_path: Destination file
+    """
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        output_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
 
 
 class OutputExporter:
@@ -18,10 +50,24 @@ class OutputExporter:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Create subdirectories
-        (self.output_dir / "merged_feature_files").mkdir(exist_ok=True)
-        (self.output_dir / "python_tests").mkdir(exist_ok=True)
-        (self.output_dir / "fusion_reports").mkdir(exist_ok=True)
+        # Subdirectories are created on first export of each kind
+        self._subdirs: Dict[str, Path] = {}
+    
+    def _subdir(self, name: str) -> Path:
+        """Get an output subdirectory, creating it on first use.
+        
+        Args:
+            name: Subdirectory name
+            
+        Returns:
+            Path to the subdirectory
+        """
+        subdir = self._subdirs.get(name)
+        if subdir is None:
+            subdir = self.output_dir / name
+            subdir.mkdir(exist_ok=True)
+            self._subdirs[name] = subdir
+        return subdir
     
     def export_feature(
         self,
@@ -40,12 +86,11 @@ class OutputExporter:
         if not filename:
             filename = f"{self._sanitize_filename(feature.feature_name)}.feature"
         
-        output_path = self.output_dir / "merged_feature_files" / filename
-        
-        content = self._generate_feature_content(feature)
+        output_path = self._subdir("merged_feature_files") / filename
         
+        # Stream lines to disk rather than building the whole file in memory
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+            f.writelines(self._iter_feature_lines(feature))
         
         return output_path
     
@@ -66,10 +111,9 @@ class OutputExporter:
             Path to exported file
         """
         filename = f"test_{self._sanitize_filename(feature_name)}_steps.py"
-        output_path = self.output_dir / "python_tests" / filename
+        output_path = self._subdir("python_tests") / filename
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(step_definitions)
+        output_path.write_text(step_definitions, encoding='utf-8')
         
         return output_path
     
@@ -90,13 +134,10 @@ class OutputExporter:
         if not filename:
             filename = f"{self._sanitize_filename(report.feature_name)}_fusion_report.json"
         
-        output_path = self.output_dir / "fusion_reports" / filename
+        output_path = self._subdir("fusion_reports") / filename
         
-        # Convert to dict for JSON serialization
-        report_dict = report.model_dump()
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report_dict, f, indent=2, ensure_ascii=False)
+        # Serialize straight from the model; no intermediate dict
+        output_path.write_text(report.model_dump_json(indent=2), encoding='utf-8')
         
         return output_path
     
@@ -115,10 +156,9 @@ class OutputExporter:
             Path to exported file
         """
         filename = f"{self._sanitize_filename(feature_name)}_mapping_table.json"
-        output_path = self.output_dir / "fusion_reports" / filename
+        output_path = self._subdir("fusion_reports") / filename
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(mapping_table, f, indent=2, ensure_ascii=False)
+        write_json(mapping_table, output_path)
         
         return output_path
     
@@ -131,37 +171,41 @@ class OutputExporter:
         Returns:
             Feature file content
         """
-        lines = []
+        return ''.join(self._iter_feature_lines(feature))
+    
+    def _iter_feature_lines(self, feature: BDDFeature) -> Iterator[str]:
+        """Yield Gherkin feature file lines, each terminated by a newline.
         
+        Args:
+            feature: BDD feature
+            
+        Yields:
+            Feature file lines
+        """
         # Add tags
         if feature.tags:
-            lines.append(' '.join(f'@{tag}' for tag in feature.tags))
+            yield ' '.join(f'@{tag}' for tag in feature.tags) + '\n'
         
         # Add feature header
-        lines.append(f"Feature: {feature.feature_name}")
+        yield f"Feature: {feature.feature_name}\n"
         
         if feature.description:
-            lines.append(f"  {feature.description}")
-        
-        lines.append("")
+            yield f"  {feature.description}\n"
         
-        # Add scenarios
+        # Add scenarios, each preceded by a blank line
         for scenario in feature.scenarios:
+            yield '\n'
+            
             # Scenario tags
             if scenario.tags:
-                lines.append(' '.join(f'@{tag}' for tag in scenario.tags))
+                yield ' '.join(f'@{tag}' for tag in scenario.tags) + '\n'
             
             # Scenario header
-            lines.append(f"  Scenario: {scenario.name}")
+            yield f"  Scenario: {scenario.name}\n"
             
             # Scenario steps
             for step in scenario.steps:
-                step_line = f"    {step.step_type.value} {step.text}"
-                lines.append(step_line)
-            
-            lines.append("")
-        
-        return '\n'.join(lines)
+                yield f"    {_STEP_KEYWORDS[step.step_type]} {step.text}\n"
     
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize a string for use as filename.
@@ -172,9 +216,8 @@ class OutputExporter:
         Returns:
             Sanitized name
         """
-        import re
         # Replace spaces and special characters
-        name = re.sub(r'[^\w\s-]', '', name)
-        name = re.sub(r'[-\s]+', '_', name)
+        name = _NONWORD_RE.sub('', name)
+        name = _COLLAPSE_RE.sub('_', name)
         return name.lower().strip('_')
 
@@ -1,9 +1,21 @@
 """Fusion mapper that maps BDD steps to locator variables."""
 
+import operator
 import re
-from typing import List, Dict, Optional, Tuple
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, List, Dict, Optional, Tuple, cast
+
+# Optional linear-time regex engine (google-re2)
+try:
+    import re2  # type: ignore
+except ImportError:
+    re2 = None
+
 from core.utils.models import (
     BDDFeature,
+    BDDScenario,
     BDDStep,
     LocatorDictionary,
     MappingResult,
@@ -13,32 +25,118 @@ from core.utils.models import (
 )
 
 
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+
+# Step type -> its text for mapping table rows, avoiding the enum's
+# ``.value`` descriptor once per step
+_STEP_TYPE_VALUES = {step_type: step_type.value for step_type in StepType}
+
+
+def _compile_token_re(pattern: str) -> Any:
+    """Compile a case-insensitive token pattern for ASCII text.
+    
+    Uses RE2 when installed, whose automaton scans in linear time
+    regardless of input; otherwise falls back to the stdlib ``re``
+    backtracking engine. Both expose ``findall``. RE2's ``\\w``, ``\\s``
+    and case folding only cover ASCII, so the result must only scan ASCII
+    text; anything else goes through the stdlib patterns.
+    """
+    if re2 is not None:
+        return re2.compile("(?i)" + pattern)
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _build_rewrite_pattern(
+    quoted_tokens: Tuple[str, ...],
+    word_tokens: Tuple[str, ...]
+) -> "re.Pattern[str]":
+    """Compile one regex matching every token occurrence to rewrite.
+    
+    Quoted tokens match only their exact quoted literal, quotes included;
+    the other tokens match as whole words in any case, leaving surrounding
+    quotes in place. Longer tokens are tried first so a token is never
+    shadowed by one of its own prefixes.
+    """
+    branches = []
+    if quoted_tokens:
+        branches.append(f'"(?:{_token_alternation(quoted_tokens)})"')
+    if word_tokens:
+        branches.append(rf'(?i:\b(?:{_token_alternation(word_tokens)})\b)')
+    return re.compile("|".join(branches))
+
+
+def _token_alternation(tokens: Tuple[str, ...]) -> str:
+    """Escape and join tokens into an alternation, longest first."""
+    return "|".join(re.escape(token) for token in sorted(tokens, key=len, reverse=True))
+
+
+@lru_cache(maxsize=2048)
+def _scan_tokens(text: str, token_patterns: Tuple[Any, ...]) -> Tuple[str, ...]:
+    """Scan text for tokens, lower-case them and drop duplicates.
+    
+    Memoized because identical step texts recur across scenarios
+    (backgrounds, outlines); the tuple result is safe to share. Tokens are
+    interned, like the locator names they are looked up against, so dict
+    hits compare by identity.
+    
+    Args:
+        text: Step text
+        token_patterns: Compiled patterns with one capture group each,
+            run as separate passes since their matches may overlap
+        
+    Returns:
+        Tokens in pattern order, each pattern's in order of appearance
+    """
+    tokens = (token for pattern in token_patterns for token in pattern.findall(text))
+    return tuple(dict.fromkeys(sys.intern(t.lower().strip()) for t in tokens if t))
+
+
+# Mapping patterns for different step types (module level so the class
+# body below does not refer to its own names, which mypyc cannot compile)
+_STEP_PATTERNS: Dict[str, List[str]] = {
+    "input": [
+        r'enter\s+(?:text\s+)?(?:into\s+)?["\']?(\w+)["\']?',
+        r'fill\s+["\']?(\w+)["\']?',
+        r'type\s+(?:in\s+)?(?:to\s+)?["\']?(\w+)["\']?',
+        r'input\s+(?:text\s+)?(?:into\s+)?["\']?(\w+)["\']?',
+    ],
+    "click": [
+        r'click\s+(?:on\s+)?["\']?(\w+)["\']?',
+        r'press\s+["\']?(\w+)["\']?',
+        r'tap\s+(?:on\s+)?["\']?(\w+)["\']?',
+    ],
+    "select": [
+        r'select\s+["\']?(\w+)["\']?',
+        r'choose\s+["\']?(\w+)["\']?',
+    ],
+    "assert": [
+        r'see\s+["\']?(\w+)["\']?',
+        r'verify\s+["\']?(\w+)["\']?',
+        r'check\s+["\']?(\w+)["\']?',
+    ],
+}
+
+# Token pattern sources: quoted strings, then every step pattern
+_TOKEN_SOURCES: List[str] = [_QUOTED_RE.pattern] + [
+    pattern for patterns in _STEP_PATTERNS.values() for pattern in patterns
+]
+
+
 class FusionMapper:
     """Maps BDD steps to locator variables."""
     
     # Mapping patterns for different step types
-    STEP_PATTERNS = {
-        "input": [
-            r'enter\s+(?:text\s+)?(?:into\s+)?["\']?(\w+)["\']?',
-            r'fill\s+["\']?(\w+)["\']?',
-            r'type\s+(?:in\s+)?(?:to\s+)?["\']?(\w+)["\']?',
-            r'input\s+(?:text\s+)?(?:into\s+)?["\']?(\w+)["\']?',
-        ],
-        "click": [
-            r'click\s+(?:on\s+)?["\']?(\w+)["\']?',
-            r'press\s+["\']?(\w+)["\']?',
-            r'tap\s+(?:on\s+)?["\']?(\w+)["\']?',
-        ],
-        "select": [
-            r'select\s+["\']?(\w+)["\']?',
-            r'choose\s+["\']?(\w+)["\']?',
-        ],
-        "assert": [
-            r'see\s+["\']?(\w+)["\']?',
-            r'verify\s+["\']?(\w+)["\']?',
-            r'check\s+["\']?(\w+)["\']?',
-        ],
-    }
+    STEP_PATTERNS = _STEP_PATTERNS
+    
+    # Quoted strings first, then every step pattern, each compiled once.
+    # They are scanned in separate passes: matches of different patterns
+    # overlap, and in a single alternation a keyword branch could consume
+    # the opening quote of a quoted value.
+    _TOKEN_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in _TOKEN_SOURCES)
+    
+    # The same patterns on the RE2 engine when installed, for ASCII steps
+    _ASCII_TOKEN_PATTERNS = tuple(_compile_token_re(pattern) for pattern in _TOKEN_SOURCES)
     
     def __init__(self, config: Optional[FusionConfig] = None):
         """Initialize the fusion mapper.
@@ -62,73 +160,170 @@ class FusionMapper:
         Returns:
             Tuple of (enhanced_feature, fusion_report)
         """
+        enhanced_feature, report, _ = self._map_feature(feature, locator_dict)
+        return enhanced_feature, report
+    
+    def map_feature_with_table(
+        self,
+        feature: BDDFeature,
+        locator_dict: LocatorDictionary
+    ) -> Tuple[BDDFeature, FusionReport, Dict]:
+        """Map a BDD feature and build its traceability mapping table.
+        
+        Equivalent to map_feature followed by generate_mapping_table on the
+        enhanced feature, but each table row is built right after its step
+        is mapped, so the steps are walked once instead of twice.
+        
+        Args:
+            feature: BDD feature to map
+            locator_dict: Dictionary of available locators
+            
+        Returns:
+            Tuple of (enhanced_feature, fusion_report, mapping_table)
+        """
+        enhanced_feature, report, mapping_table = self._map_feature(feature, locator_dict, build_table=True)
+        return enhanced_feature, report, cast(Dict, mapping_table)
+    
+    def _map_feature(
+        self,
+        feature: BDDFeature,
+        locator_dict: LocatorDictionary,
+        build_table: bool = False
+    ) -> Tuple[BDDFeature, FusionReport, Optional[Dict]]:
+        """Map a feature, optionally building the mapping table in the same pass.
+        
+        Args:
+            feature: BDD feature to map
+            locator_dict: Dictionary of available locators
+            build_table: Also build the traceability mapping table
+            
+        Returns:
+            Tuple of (enhanced_feature, fusion_report, mapping_table or None)
+        """
+        # Whole steps recur (backgrounds, copy-pasted steps), so their mapped
+        # results are memoized for this feature. Plain dict get/set is
+        # atomic, so worker threads can share the cache.
+        step_cache: Dict[Tuple[StepType, str, str], Tuple[BDDStep, MappingResult]] = {}
+        
+        map_scenario = partial(
+            self._map_scenario,
+            locator_dict=locator_dict,
+            step_cache=step_cache,
+            build_table=build_table
+        )
+        
+        # Scenarios are independent, so they can be mapped concurrently;
+        # executor.map keeps results in scenario order
+        max_workers = self.config.max_workers
+        if max_workers > 1 and len(feature.scenarios) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(map_scenario, feature.scenarios))
+        else:
+            results = list(map(map_scenario, feature.scenarios))
+        
+        # Split the per-scenario results with comprehensions and count in
+        # locals, so the feature and report are each constructed once
+        # instead of being mutated step by step
+        mappings = [mapping for _, scenario_mappings, _ in results for mapping in scenario_mappings]
+        matched_steps = sum(1 for mapping in mappings if mapping.matched)
+        
+        # Dict keys act as an insertion-ordered set of unmatched tokens
+        unmatched = dict.fromkeys(
+            token
+            for mapping in mappings
+            if not mapping.matched
+            for token in mapping.step.tokens
+        )
+        
+        mapping_table = None
+        if build_table:
+            mapping_table = {
+                "feature": feature.feature_name,
+                "scenarios": [
+                    {"scenario": enhanced_scenario.name, "steps": rows}
+                    for enhanced_scenario, _, rows in results
+                ]
+            }
+        
+        # Plain constructors throughout: pydantic-core validation of these
+        # small models is faster than the pure-Python model_construct path
         enhanced_feature = BDDFeature(
             feature_name=feature.feature_name,
             description=feature.description,
-            tags=feature.tags.copy(),
-            scenarios=[]
+            tags=feature.tags,
+            scenarios=[enhanced_scenario for enhanced_scenario, _, _ in results]
         )
         
         report = FusionReport(
             feature_name=feature.feature_name,
-            total_steps=0,
-            matched_steps=0,
-            unmatched_steps=0,
-            mappings=[],
-            unmatched_tokens=[],
+            total_steps=len(mappings),
+            matched_steps=matched_steps,
+            unmatched_steps=len(mappings) - matched_steps,
+            mappings=mappings,
+            unmatched_tokens=list(unmatched),
             warnings=[],
             validation_results={}
         )
         
-        # Process each scenario
-        for scenario in feature.scenarios:
-            enhanced_scenario = self._map_scenario(scenario, locator_dict, report)
-            enhanced_feature.scenarios.append(enhanced_scenario)
-        
-        # Calculate statistics
-        report.total_steps = len(report.mappings)
-        report.matched_steps = sum(1 for m in report.mappings if m.matched)
-        report.unmatched_steps = report.total_steps - report.matched_steps
-        
-        # Collect unmatched tokens
-        for mapping in report.mappings:
-            if not mapping.matched and mapping.step.tokens:
-                report.unmatched_tokens.extend(mapping.step.tokens)
-        
-        report.unmatched_tokens = list(set(report.unmatched_tokens))
-        
-        return enhanced_feature, report
+        return enhanced_feature, report, mapping_table
     
     def _map_scenario(
         self,
-        scenario,
+        scenario: BDDScenario,
         locator_dict: LocatorDictionary,
-        report: FusionReport
-    ) -> "BDDScenario":
+        step_cache: Optional[Dict[Tuple[StepType, str, str], Tuple[BDDStep, MappingResult]]] = None,
+        build_table: bool = False
+    ) -> Tuple[BDDScenario, List[MappingResult], Optional[List[Dict]]]:
         """Map a scenario's steps to locators.
         
+        Does not touch any shared report state, so scenarios can be mapped
+        concurrently.
+        
         Args:
             scenario: BDD scenario
             locator_dict: Dictionary of available locators
-            report: Fusion report to update
+            step_cache: Memoized _map_step results keyed by step type and
+                text, shared across scenarios
+            build_table: Also build mapping table rows for the mapped steps
             
         Returns:
-            Enhanced scenario with mapped steps
+            Tuple of (enhanced_scenario, mapping_results, table_rows or None)
         """
-        from core.utils.models import BDDScenario
-        
-        enhanced_scenario = BDDScenario(
-            name=scenario.name,
-            tags=scenario.tags.copy(),
-            steps=[]
-        )
+        mapped_steps = []
+        mappings = []
+        rows: Optional[List[Dict]] = [] if build_table else None
+        if step_cache is None:
+            step_cache = {}
         
         for step in scenario.steps:
-            mapped_step, mapping_result = self._map_step(step, locator_dict)
-            enhanced_scenario.steps.append(mapped_step)
-            report.mappings.append(mapping_result)
-        
-        return enhanced_scenario
+            key = (step.step_type, step.text, step.original_text)
+            cached = step_cache.get(key)
+            if cached is None:
+                mapped_step, mapping_result = step_cache[key] = self._map_step(
+                    step,
+                    locator_dict
+                )
+            else:
+                # Mapped steps are frozen and can be shared; the result
+                # must still point at this scenario's own step
+                mapped_step, mapping_result = cached
+                mapping_result = mapping_result.model_copy(update={"step": step})
+            mapped_steps.append(mapped_step)
+            mappings.append(mapping_result)
+            if rows is not None:
+                rows.append(self._mapping_row(mapped_step, locator_dict))
+        
+        # Constructed once its steps are collected, like the feature; a
+        # scenario none of whose steps changed is shared as is
+        if all(map(operator.is_, mapped_steps, scenario.steps)):
+            enhanced_scenario = scenario
+        else:
+            enhanced_scenario = BDDScenario(
+                name=scenario.name,
+                tags=scenario.tags,
+                steps=mapped_steps
+            )
+        return enhanced_scenario, mappings, rows
     
     def _map_step(
         self,
@@ -144,6 +339,10 @@ class FusionMapper:
         Returns:
             Tuple of (enhanced_step, mapping_result)
         """
+        # Keys are the normalized names, so every exact, partial or fuzzy hit
+        # resolves with one hash lookup on the flat name -> LocatorInfo index
+        locators = locator_dict.locators
+        
         # Extract tokens from step text
         tokens = self._extract_tokens_from_step(step.text)
         
@@ -154,7 +353,7 @@ class FusionMapper:
         
         for token in tokens:
             # Try exact match first
-            locator_info = locator_dict.get_locator(token)
+            locator_info = locators.get(token)
             if locator_info:
                 matched_locator = locator_info.variable_name
                 match_type = "exact"
@@ -164,25 +363,45 @@ class FusionMapper:
             if self.config.enable_partial_matching:
                 partial_match = locator_dict.find_partial_match(token)
                 if partial_match:
-                    locator_info = locator_dict.get_locator(partial_match)
+                    locator_info = locators[partial_match]
                     matched_locator = locator_info.variable_name
                     match_type = "partial"
                     warning = f"Partial match: '{token}' -> '{partial_match}'"
                     break
+            
+            # Last resort: tolerate typos within the configured edit distance
+            if self.config.fuzzy_max_distance > 0:
+                fuzzy_match = locator_dict.find_fuzzy_match(token, self.config.fuzzy_max_distance)
+                if fuzzy_match:
+                    locator_info = locators[fuzzy_match]
+                    matched_locator = locator_info.variable_name
+                    match_type = "fuzzy"
+                    warning = f"Fuzzy match: '{token}' -> '{fuzzy_match}'"
+                    break
         
         # Create enhanced step text
         enhanced_text = self._rewrite_step_text(step.text, matched_locator, tokens)
         
-        # Create enhanced step
-        enhanced_step = BDDStep(
-            step_type=step.step_type,
-            text=enhanced_text,
-            tokens=tokens,
-            mapped_locator=matched_locator,
-            original_text=step.original_text
-        )
+        # Create enhanced step. Steps are frozen, so an unmatched step whose
+        # fields would all come out unchanged is shared rather than copied.
+        if matched_locator is None and step.mapped_locator is None and step.tokens == tokens:
+            enhanced_step = step
+        else:
+            enhanced_step = BDDStep(
+                step_type=step.step_type,
+                text=enhanced_text,
+                tokens=tokens,
+                mapped_locator=matched_locator,
+                original_text=step.original_text
+            )
         
-        # Create mapping result
+        # Add warning if no match found
+        if not matched_locator and tokens:
+            if self.config.strict_mode:
+                warning = f"No locator found for tokens: {', '.join(tokens)}"
+        
+        # Create mapping result (the step is a model instance, so it is
+        # accepted as is rather than re-validated)
         mapping_result = MappingResult(
             step=step,
             matched=matched_locator is not None,
@@ -191,12 +410,6 @@ class FusionMapper:
             warning=warning
         )
         
-        # Add warning if no match found
-        if not matched_locator and tokens:
-            if self.config.strict_mode:
-                warning = f"No locator found for tokens: {', '.join(tokens)}"
-                mapping_result.warning = warning
-        
         return enhanced_step, mapping_result
     
     def _extract_tokens_from_step(self, step_text: str) -> List[str]:
@@ -208,25 +421,11 @@ class FusionMapper:
         Returns:
             List of extracted tokens
         """
-        tokens = []
-        
-        # Extract quoted strings
-        quoted = re.findall(r'"([^"]+)"', step_text)
-        tokens.extend(quoted)
-        
-        # Extract tokens using patterns
-        for pattern_type, patterns in self.STEP_PATTERNS.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, step_text, re.IGNORECASE)
-                tokens.extend(matches)
-        
-        # Normalize tokens
-        tokens = [t.lower().strip() for t in tokens if t]
-        
-        # Remove duplicates
-        tokens = list(set(tokens))
-        
-        return tokens
+        # Tokens keep first-seen order so the "first token wins" matching in
+        # _map_step is deterministic
+        if step_text.isascii():
+            return list(_scan_tokens(step_text, self._ASCII_TOKEN_PATTERNS))
+        return list(_scan_tokens(step_text, self._TOKEN_PATTERNS))
     
     def _rewrite_step_text(
         self,
@@ -247,24 +446,18 @@ class FusionMapper:
         if not locator_variable:
             return original_text
         
-        # Replace tokens with locator variable
-        enhanced_text = original_text
+        if not tokens:
+            return original_text
         
-        for token in tokens:
-            # Replace quoted tokens
-            pattern = f'"{token}"'
-            if pattern in enhanced_text:
-                enhanced_text = enhanced_text.replace(pattern, f"${{{locator_variable}}}")
-            else:
-                # Replace unquoted tokens
-                enhanced_text = re.sub(
-                    rf'\b{re.escape(token)}\b',
-                    f"${{{locator_variable}}}",
-                    enhanced_text,
-                    flags=re.IGNORECASE
-                )
+        # A token whose exact quoted literal appears in the text replaces
+        # that literal, quotes included; any other token replaces its
+        # whole-word occurrences only. All of them go in a single scan.
+        quoted_tokens = tuple(token for token in tokens if f'"{token}"' in original_text)
+        word_tokens = tuple(token for token in tokens if token not in quoted_tokens)
         
-        return enhanced_text
+        replacement = f"${{{locator_variable}}}"
+        pattern = _build_rewrite_pattern(quoted_tokens, word_tokens)
+        return pattern.sub(lambda match: replacement, original_text)
     
     def generate_mapping_table(self, feature: BDDFeature, locator_dict: LocatorDictionary) -> Dict:
         """Generate a mapping table for traceability.
@@ -276,38 +469,51 @@ class FusionMapper:
         Returns:
             Mapping table dictionary
         """
-        mapping_table = {
+        mapping_table: Dict[str, Any] = {
             "feature": feature.feature_name,
             "scenarios": []
         }
         
         for scenario in feature.scenarios:
-            scenario_mapping = {
+            scenario_mapping: Dict[str, Any] = {
                 "scenario": scenario.name,
                 "steps": []
             }
             
             for step in scenario.steps:
-                tokens = self._extract_tokens_from_step(step.text)
-                matched_locators = []
-                
-                for token in tokens:
-                    locator_info = locator_dict.get_locator(token)
-                    if locator_info:
-                        matched_locators.append({
-                            "token": token,
-                            "locator_variable": locator_info.variable_name,
-                            "locator_expression": locator_info.locator_expression
-                        })
-                
-                scenario_mapping["steps"].append({
-                    "step_type": step.step_type.value,
-                    "step_text": step.text,
-                    "tokens": tokens,
-                    "matched_locators": matched_locators
-                })
+                scenario_mapping["steps"].append(self._mapping_row(step, locator_dict))
             
             mapping_table["scenarios"].append(scenario_mapping)
         
         return mapping_table
+    
+    def _mapping_row(self, step: BDDStep, locator_dict: LocatorDictionary) -> Dict:
+        """Build the mapping table row for one step.
+        
+        Args:
+            step: BDD step (already mapped)
+            locator_dict: Locator dictionary
+            
+        Returns:
+            Mapping table row dictionary
+        """
+        tokens = self._extract_tokens_from_step(step.text)
+        locators = locator_dict.locators
+        matched_locators = []
+        
+        for token in tokens:
+            locator_info = locators.get(token)
+            if locator_info:
+                matched_locators.append({
+                    "token": token,
+                    "locator_variable": locator_info.variable_name,
+                    "locator_expression": locator_info.locator_expression
+                })
+        
+        return {
+            "step_type": _STEP_TYPE_VALUES[step.step_type],
+            "step_text": step.text,
+            "tokens": tokens,
+            "matched_locators": matched_locators
+        }
 
@@ -1,5 +1,6 @@
 """Locator engine for parsing and extracting locators."""
 
 from .parser import LocatorParser
+from .cache import ParseCache
 
-__all__ = ["LocatorParser"]
+__all__ = ["LocatorParser", "ParseCache"]
@@ -0,0 +1,115 @@
+"""Persistent cache of parsed locator files."""
+
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from core.utils.models import LocatorDictionary, LocatorType
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".smartfusion" / "parse_cache.db"
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS cache ("
+    "path TEXT, hash TEXT, locator_type TEXT, blob BLOB, "
+    "PRIMARY KEY (path, hash, locator_type))"
+)
+
+
+def _dump_locators(dictionary: LocatorDictionary) -> bytes:
+    """Serialize a dictionary's locators for storage."""
+    return json.dumps({
+        name: locator_info.model_dump(mode="json")
+        for name, locator_info in dictionary.locators.items()
+    }).encode()
+
+
+class ParseCache:
+    """SQLite-backed cache of parsed LocatorDictionary objects.
+    
+    Entries are keyed by file path, SHA-256 of the file content and locator
+    type, so an edited file simply misses and stale entries are never
+    returned. Entries are stored as JSON and validated on load rather than
+    unpickled, so the database never executes code and an entry written
+    for an older model shape fails validation instead of leaking into a
+    run. Cache failures are treated as misses and never break parsing.
+    """
+    
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_CACHE_PATH):
+        """Initialize the cache.
+        
+        Args:
+            db_path: SQLite database file (created on first write)
+        """
+        self.db_path = Path(db_path)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the database and table if needed."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(_SCHEMA)
+        return conn
+    
+    def get(self, path: str, digest: str, locator_type: LocatorType) -> Optional[LocatorDictionary]:
+        """Look up a parsed dictionary.
+        
+        Args:
+            path: Absolute path of the locator file
+            digest: SHA-256 hex digest of the file content
+            locator_type: Locator type the file was parsed with
+            
+        Returns:
+            Cached LocatorDictionary, or None on a miss
+        """
+        key = (path, digest, locator_type.value)
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT blob FROM cache WHERE path = ? AND hash = ? AND locator_type = ?",
+                    key
+                ).fetchone()
+        except (OSError, sqlite3.Error):
+            return None
+        if row is None:
+            return None
+        
+        # Entries hold only the locators; the lookup columns are rebuilt
+        # here, so changes to them never invalidate stored entries. Blobs
+        # that no longer load or validate (an older layout or model shape)
+        # are misses and are dropped so they are not retried.
+        try:
+            return LocatorDictionary(locators=json.loads(row[0]))
+        except Exception:
+            self._delete(key)
+            return None
+    
+    def _delete(self, key: Tuple[str, str, str]):
+        """Remove one entry, ignoring failures."""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "DELETE FROM cache WHERE path = ? AND hash = ? AND locator_type = ?",
+                    key
+                )
+        except (OSError, sqlite3.Error):
+            pass
+    
+    def put(self, path: str, digest: str, locator_type: LocatorType, dictionary: LocatorDictionary):
+        """Store a parsed dictionary.
+        
+        Args:
+            path: Absolute path of the locator file
+            digest: SHA-256 hex digest of the file content
+            locator_type: Locator type the file was parsed with
+            dictionary: Parsed locators for this file alone
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (path, hash, locator_type, blob) VALUES (?, ?, ?, ?)",
+                    (path, digest, locator_type.value, _dump_locators(dictionary))
+                )
+        except (OSError, sqlite3.Error):
+            pass
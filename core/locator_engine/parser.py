@@ -1,23 +1,315 @@
 """Parser for extracting locators from page.py or locators.json files."""
 
 import re
+import os
+import sys
+import mmap
+import hashlib
 import json
 import ast
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Iterable, Iterator, Optional, List, Sequence, Tuple
+
+# Optional fast JSON decoders, best first (orjson, then pysimdjson's
+# drop-in loads); stdlib json.loads also accepts bytes
+try:
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:
+    try:
+        from simdjson import loads as _json_loads  # type: ignore
+    except ImportError:
+        _json_loads = json.loads
+
+# Optional incremental JSON parser for very large locator files
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
+
+from core import __version__
 from core.utils.models import LocatorInfo, LocatorDictionary, LocatorType
+from core.locator_engine.cache import ParseCache
+
+
+# Name normalization patterns
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+_CAMEL_RE = re.compile(r'(?<!^)(?=[A-Z])')
+_MULTI_US_RE = re.compile(r'_+')
+
+# Common locator suffix at the end of a name, or a camelCase boundary
+_NORMALIZE_RE = re.compile(
+    r'(?:_input|_button|_link|_field|_element|_selector|_locator)$'
+    r'|(?<!^)(?=[A-Z])'
+)
+
+
+def _normalize_repl(match: "re.Match[str]") -> str:
+    """Drop a matched suffix; turn a (zero-width) camelCase boundary into '_'."""
+    return '' if match.group() else '_'
+
+
+# Name conversions are pure and the same names recur across files and
+# entries, so results are memoized at module level (shared by all parsers)
+@lru_cache(maxsize=4096)
+def _normalize_name_cached(name: str) -> str:
+    """Normalize a variable name; see LocatorParser._normalize_name."""
+    # Strip a common suffix and split camelCase in a single scan
+    name = _NORMALIZE_RE.sub(_normalize_repl, name).lower()
+    
+    # Clean up
+    name = name.replace('__', '_').strip('_')
+    
+    # Interned: these become LocatorDictionary keys, matched against
+    # (interned) step tokens by identity before any string compare
+    return sys.intern(name)
+
+
+@lru_cache(maxsize=4096)
+def _to_snake_case_cached(name: str) -> str:
+    """Convert a name to snake_case; see LocatorParser._to_snake_case."""
+    # Remove special characters and split
+    name = _NON_ALNUM_RE.sub('_', name)
+    # Convert camelCase to snake_case
+    name = _CAMEL_RE.sub('_', name).lower()
+    # Clean up
+    name = _MULTI_US_RE.sub('_', name).strip('_')
+    return name
+
+
+# locators.json files larger than this are streamed (when ijson is
+# installed) instead of being decoded into one in-memory document
+_JSON_STREAM_THRESHOLD = 8 * 1024 * 1024
+
+# Version of what the parse cache stores. Bump it whenever parsing logic
+# or the LocatorInfo model changes: __version__ is not bumped for every
+# such change, and entries from older logic must never be reused.
+_CACHE_SCHEMA = 2
+
+# Mixed into cache digests so a new release or schema never reuses entries
+# produced by older parsing logic
+_CACHE_SALT = f"smartfusion-{__version__}-schema{_CACHE_SCHEMA}\0".encode()
+
+# Locator expression per SmartLocatorAI locator kind; %s is the locator value
+_LOCATOR_TEMPLATE = {
+    'role': "page.get_by_role('%s')",
+    'text': "page.get_by_text('%s')",
+    'css': "page.locator('%s')",
+}
+
+# Keywords that open a compound statement; a top-level ':' on such a line
+# starts the (one-line) body
+_COMPOUND_KEYWORDS = frozenset({
+    'if', 'elif', 'else', 'for', 'while', 'try', 'except', 'finally',
+    'with', 'def', 'class', 'async', 'match', 'case',
+})
+
+_SKIP_TOKENS = frozenset({
+    tokenize.COMMENT, tokenize.NL, tokenize.INDENT, tokenize.DEDENT,
+    tokenize.ENCODING,
+})
+
+
+def _iter_statements(tokens: Iterable[tokenize.TokenInfo]) -> Iterator[List[tokenize.TokenInfo]]:
+    """Split a token stream into simple statements in a single pass.
+    
+    Statements end at a NEWLINE token or at a top-level ';'. The body of
+    a one-line compound statement (``if x: self.a = 1``) is yielded as a
+    statement of its own.
+    
+    Raises:
+        tokenize.TokenError: On unterminated brackets or strings
+        SyntaxError: On inconsistent indentation
+    """
+    statement: List[tokenize.TokenInfo] = []
+    depth = 0
+    compound = False
+    pending_lambdas = 0
+    
+    for tok in tokens:
+        if tok.type in _SKIP_TOKENS:
+            continue
+        if tok.type in (tokenize.NEWLINE, tokenize.ENDMARKER):
+            if statement:
+                yield statement
+            statement, depth, compound, pending_lambdas = [], 0, False, 0
+            continue
+        
+        if tok.type == tokenize.OP:
+            if tok.string in '([{':
+                depth += 1
+            elif tok.string in ')]}':
+                depth -= 1
+            elif depth == 0 and tok.string == ';':
+                if statement:
+                    yield statement
+                statement, compound, pending_lambdas = [], False, 0
+                continue
+            elif depth == 0 and tok.string == ':' and compound:
+                # A lambda's ':' belongs to the expression; otherwise this
+                # colon opens the compound statement's body
+                if pending_lambdas:
+                    pending_lambdas -= 1
+                else:
+                    statement, compound = [], False
+                    continue
+        elif tok.type == tokenize.NAME:
+            if not statement and tok.string in _COMPOUND_KEYWORDS:
+                compound = True
+            elif tok.string == 'lambda':
+                pending_lambdas += 1
+        
+        statement.append(tok)
+
+
+def _attribute_target(tokens: List[tokenize.TokenInfo]) -> Optional[str]:
+    """Return the final attribute name of a dotted target like ``self.a.b``.
+    
+    Returns None for a plain name (``x``) and for anything that is not a
+    plain dotted name (subscripts, calls, tuples).
+    """
+    if len(tokens) < 3 or len(tokens) % 2 == 0:
+        return None
+    for i, tok in enumerate(tokens):
+        expected = tokenize.NAME if i % 2 == 0 else tokenize.OP
+        if tok.type != expected or (expected == tokenize.OP and tok.string != '.'):
+            return None
+    return tokens[-1].string
+
+
+def _join_tokens(tokens: List[tokenize.TokenInfo]) -> str:
+    """Render an expression from its tokens with normalized whitespace.
+    
+    Comments and non-logical newlines are already dropped from the
+    statement, so a call split across lines renders on one line, like
+    ``ast.unparse`` would. Tokens keep their source text. Any whitespace
+    between two tokens on one line becomes a single space; a line break
+    becomes a space too, except just inside brackets.
+    """
+    parts = [tokens[0].string]
+    prev = tokens[0]
+    for tok in tokens[1:]:
+        if tok.start[0] == prev.end[0]:
+            if tok.start[1] > prev.end[1]:
+                parts.append(' ')
+        elif prev.string not in ('(', '[', '{') and tok.string not in (')', ']', '}'):
+            parts.append(' ')
+        parts.append(tok.string)
+        prev = tok
+    # Match text-mode reads, which translate CRLF line endings
+    return ''.join(parts).replace('\r\n', '\n')
+
+
+def _scan_assignments(readline: Callable[[], bytes]) -> Iterator[Tuple[str, str]]:
+    """Find attribute assignments (``self.name = <expr>``) without an AST.
+    
+    Mirrors what _LocatorVisitor collects, in source order. The value
+    expression is rebuilt from its tokens (see _join_tokens).
+    
+    Args:
+        readline: Bytes readline of the Python source (as for
+            ``tokenize.tokenize``)
+        
+    Yields:
+        Tuples of (attribute_name, value_expression)
+    """
+    for statement in _iter_statements(tokenize.tokenize(readline)):
+        # Peel off leading "<target> =" segments (chained assignment);
+        # whatever follows the last one is the value
+        attrs: List[str] = []
+        value_index = 0
+        segment_start = 0
+        depth = 0
+        for i, tok in enumerate(statement):
+            if tok.type != tokenize.OP:
+                continue
+            if tok.string in '([{':
+                depth += 1
+            elif tok.string in ')]}':
+                depth -= 1
+            elif depth == 0 and tok.string == '=':
+                target = statement[segment_start:i]
+                attr = _attribute_target(target)
+                if attr is None and not (len(target) == 1 and target[0].type == tokenize.NAME):
+                    break
+                if attr is not None:
+                    attrs.append(attr)
+                value_index = segment_start = i + 1
+        
+        if attrs and value_index < len(statement):
+            locator_expr = _join_tokens(statement[value_index:])
+            for attr in attrs:
+                yield attr, locator_expr
+
+
+class _LocatorVisitor(ast.NodeVisitor):
+    """Collects ``self.<name> = <locator>`` assignments from a page module.
+    
+    Only statement nodes are traversed (module, class and function bodies,
+    control-flow blocks); expression subtrees can never contain an
+    assignment statement, so they are skipped entirely.
+    """
+    
+    def __init__(self, parser: "LocatorParser", dictionary: LocatorDictionary, content: str):
+        self.parser = parser
+        self.dictionary = dictionary
+        self.content = content
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case)):
+                self.visit(child)
+    
+    def visit_Assign(self, node: ast.Assign) -> None:
+        parser = self.parser
+        
+        # Look for assignments like: self.user_name_input = page.locator(...)
+        for target in node.targets:
+            if isinstance(target, ast.Attribute):
+                var_name = f"self.{target.attr}"
+                normalized_name = parser._normalize_name(target.attr)
+                
+                # Extract locator expression
+                try:
+                    locator_expr = ast.unparse(node.value)
+                except Exception:
+                    locator_expr = parser._extract_locator_expr(node.value, self.content)
+                
+                locator_info = LocatorInfo(
+                    variable_name=var_name,
+                    locator_expression=locator_expr,
+                    normalized_name=normalized_name,
+                    locator_type=parser.locator_type
+                )
+                
+                self.dictionary.add_locator(normalized_name, locator_info)
+
+
+def _parse_one(args: Tuple[str, LocatorType, Optional[ParseCache]]) -> LocatorDictionary:
+    """Parse one locator file with a fresh parser (process pool worker)."""
+    file_path, locator_type, cache = args
+    return LocatorParser(locator_type, cache=cache).parse(file_path)
 
 
 class LocatorParser:
     """Parser for extracting locators from various formats."""
     
-    def __init__(self, locator_type: LocatorType = LocatorType.PLAYWRIGHT):
+    def __init__(
+        self,
+        locator_type: LocatorType = LocatorType.PLAYWRIGHT,
+        cache: Optional[ParseCache] = None
+    ):
         """Initialize the parser.
         
         Args:
             locator_type: Type of locator framework (Playwright or Selenium)
+            cache: Optional persistent cache consulted by parse()
         """
         self.locator_type = locator_type
+        self.cache = cache
+        # Result of the most recent parse, kept only for get_dictionary()
         self.dictionary = LocatorDictionary()
     
     def parse_page_py(self, file_path: str) -> LocatorDictionary:
@@ -29,44 +321,35 @@ class LocatorParser:
         Returns:
             LocatorDictionary with extracted locators
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Parse Python AST
-        tree = ast.parse(content)
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Assign):
-                # Look for assignments like: self.user_name_input = page.locator(...)
-                for target in node.targets:
-                    if isinstance(target, ast.Attribute):
-                        var_name = f"self.{target.attr}"
-                        normalized_name = self._normalize_name(target.attr)
-                        
-                        # Extract locator expression
-                        try:
-                            if hasattr(ast, 'unparse'):
-                                locator_expr = ast.unparse(node.value)
-                            else:
-                                # Fallback for Python < 3.9
-                                import astor
-                                try:
-                                    locator_expr = astor.to_source(node.value).strip()
-                                except ImportError:
-                                    locator_expr = self._extract_locator_expr(node.value, content)
-                        except Exception:
-                            locator_expr = self._extract_locator_expr(node.value, content)
-                        
-                        locator_info = LocatorInfo(
-                            variable_name=var_name,
-                            locator_expression=locator_expr,
-                            normalized_name=normalized_name,
-                            locator_type=self.locator_type
-                        )
-                        
-                        self.dictionary.add_locator(normalized_name, locator_info)
+        # A single tokenize pass over the memory-mapped file finds the
+        # assignments without allocating a full AST or a str copy of the
+        # source; fall back to the AST walk if the source won't tokenize
+        dictionary = LocatorDictionary()
+        self.dictionary = dictionary
         
-        return self.dictionary
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return dictionary
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                try:
+                    assignments = list(_scan_assignments(mm.readline))
+                except (tokenize.TokenError, SyntaxError):
+                    source = mm[:]
+                    tree = ast.parse(source, filename=file_path)
+                    _LocatorVisitor(self, dictionary, source.decode('utf-8')).visit(tree)
+                    return dictionary
+        
+        for attr, locator_expr in assignments:
+            normalized_name = self._normalize_name(attr)
+            locator_info = LocatorInfo(
+                variable_name=f"self.{attr}",
+                locator_expression=locator_expr,
+                normalized_name=normalized_name,
+                locator_type=self.locator_type
+            )
+            dictionary.add_locator(normalized_name, locator_info)
+        
+        return dictionary
     
     def parse_locators_json(self, file_path: str) -> LocatorDictionary:
         """Parse a locators.json file and extract locators.
@@ -81,78 +364,140 @@ class LocatorParser:
         Returns:
             LocatorDictionary with extracted locators
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if ijson is not None and os.path.getsize(file_path) > _JSON_STREAM_THRESHOLD:
+            return self._parse_locators_json_stream(file_path)
+        
+        return self.parse_locators_bytes(Path(file_path).read_bytes())
+    
+    def parse_locators_bytes(self, data: bytes) -> LocatorDictionary:
+        """Parse locators.json content that is already in memory.
+        
+        Accepts the same formats as parse_locators_json, for content that
+        does not come from a file (network responses, streams, tests).
+        
+        Args:
+            data: Encoded JSON document
+            
+        Returns:
+            LocatorDictionary with extracted locators
+        """
+        # Hand the raw bytes straight to the JSON decoder; orjson parses
+        # them without an intermediate str copy
+        document = _json_loads(data)
+        
+        dictionary = LocatorDictionary()
+        self.dictionary = dictionary
         
         # Check if this is SmartLocatorAI format (has "locators" array)
-        if isinstance(data, dict) and "locators" in data:
-            # SmartLocatorAI format - parse from locators array
-            for locator_entry in data.get("locators", []):
-                # Extract from SmartLocatorAI format
-                custom_name = locator_entry.get("custom_name", "")
-                locator_value = locator_entry.get("locator_value", "")
-                locator_type_str = locator_entry.get("locator_type", "CSS Selector")
-                
-                # Normalize the name
-                normalized_name = self._normalize_name(custom_name) if custom_name else ""
-                if not normalized_name:
-                    continue
-                
-                # Create variable name from custom_name
-                var_name = f"self.{self._to_snake_case(custom_name)}"
-                
-                # Build locator expression based on type
-                if "Role" in locator_type_str or "Text" in locator_type_str:
-                    # Playwright role/text locator
-                    locator_expr = f"page.get_by_role('{locator_value}')" if "Role" in locator_type_str else f"page.get_by_text('{locator_value}')"
-                else:
-                    # CSS or XPath
-                    locator_expr = f"page.locator('{locator_value}')"
-                
-                locator_info = LocatorInfo(
-                    variable_name=var_name,
-                    locator_expression=locator_expr,
-                    normalized_name=normalized_name,
-                    locator_type=self.locator_type
-                )
-                
-                self.dictionary.add_locator(normalized_name, locator_info)
+        if isinstance(document, dict) and "locators" in document:
+            for locator_entry in document.get("locators", []):
+                self._add_smartlocator_entry(dictionary, locator_entry)
         else:
             # Simple format - handle legacy structure
-            for key, value in data.items():
-                normalized_name = self._normalize_name(key)
-                
-                if isinstance(value, dict):
-                    # Structure: {"user_name": {"variable": "self.user_name_input", "locator": "..."}}
-                    var_name = value.get("variable", f"self.{key}")
-                    locator_expr = value.get("locator", value.get("expression", str(value)))
-                elif isinstance(value, str):
-                    # Structure: {"user_name": "page.locator('#username')"}
-                    var_name = f"self.{key}"
-                    locator_expr = value
-                else:
-                    continue
-                
-                locator_info = LocatorInfo(
-                    variable_name=var_name,
-                    locator_expression=locator_expr,
-                    normalized_name=normalized_name,
-                    locator_type=self.locator_type
-                )
-                
-                self.dictionary.add_locator(normalized_name, locator_info)
+            for key, value in document.items():
+                self._add_simple_entry(dictionary, key, value)
         
-        return self.dictionary
+        return dictionary
+    
+    def _parse_locators_json_stream(self, file_path: str) -> LocatorDictionary:
+        """Parse a large locators.json file incrementally with ijson.
+        
+        Entries are turned into locators as they are read, so memory stays
+        bounded by the largest single entry rather than the whole document.
+        
+        Args:
+            file_path: Path to locators.json file
+            
+        Returns:
+            LocatorDictionary with extracted locators
+        """
+        dictionary = LocatorDictionary()
+        self.dictionary = dictionary
+        
+        with open(file_path, 'rb') as f:
+            # A first pass over the top-level keys only detects the format
+            smartlocator_format = any(
+                prefix == '' and event == 'map_key' and value == 'locators'
+                for prefix, event, value in ijson.parse(f)
+            )
+            f.seek(0)
+            
+            if smartlocator_format:
+                for locator_entry in ijson.items(f, 'locators.item'):
+                    self._add_smartlocator_entry(dictionary, locator_entry)
+            else:
+                for key, value in ijson.kvitems(f, ''):
+                    self._add_simple_entry(dictionary, key, value)
+        
+        return dictionary
+    
+    def _add_smartlocator_entry(self, dictionary: LocatorDictionary, locator_entry: Dict):
+        """Add one entry of a SmartLocatorAI "locators" array.
+        
+        Args:
+            dictionary: Dictionary to add the locator to
+            locator_entry: Entry with custom_name, locator_value and locator_type
+        """
+        # Extract from SmartLocatorAI format
+        custom_name = locator_entry.get("custom_name", "")
+        locator_value = locator_entry.get("locator_value", "")
+        locator_type_str = locator_entry.get("locator_type", "CSS Selector")
+        
+        # Normalize the name
+        normalized_name = self._normalize_name(custom_name) if custom_name else ""
+        if not normalized_name:
+            return
+        
+        # Create variable name from custom_name
+        var_name = f"self.{self._to_snake_case(custom_name)}"
+        
+        # Build locator expression based on type: Playwright role/text
+        # locator, otherwise CSS or XPath
+        kind = 'role' if "Role" in locator_type_str else 'text' if "Text" in locator_type_str else 'css'
+        locator_expr = _LOCATOR_TEMPLATE[kind] % locator_value
+        
+        locator_info = LocatorInfo(
+            variable_name=var_name,
+            locator_expression=locator_expr,
+            normalized_name=normalized_name,
+            locator_type=self.locator_type
+        )
+        
+        dictionary.add_locator(normalized_name, locator_info)
+    
+    def _add_simple_entry(self, dictionary: LocatorDictionary, key: str, value):
+        """Add one entry of a simple-format locators.json file.
+        
+        Args:
+            dictionary: Dictionary to add the locator to
+            key: Locator name
+            value: Either {"variable": ..., "locator": ...} or a locator string
+        """
+        normalized_name = self._normalize_name(key)
+        
+        if isinstance(value, dict):
+            # Structure: {"user_name": {"variable": "self.user_name_input", "locator": "..."}}
+            var_name = value.get("variable", f"self.{key}")
+            locator_expr = value.get("locator", value.get("expression", str(value)))
+        elif isinstance(value, str):
+            # Structure: {"user_name": "page.locator('#username')"}
+            var_name = f"self.{key}"
+            locator_expr = value
+        else:
+            return
+        
+        locator_info = LocatorInfo(
+            variable_name=var_name,
+            locator_expression=locator_expr,
+            normalized_name=normalized_name,
+            locator_type=self.locator_type
+        )
+        
+        dictionary.add_locator(normalized_name, locator_info)
     
     def _to_snake_case(self, name: str) -> str:
         """Convert a name to snake_case."""
-        # Remove special characters and split
-        name = re.sub(r'[^a-zA-Z0-9]', '_', name)
-        # Convert camelCase to snake_case
-        name = re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
-        # Clean up
-        name = re.sub(r'_+', '_', name).strip('_')
-        return name
+        return _to_snake_case_cached(name)
     
     def parse(self, file_path: str) -> LocatorDictionary:
         """Parse a locator file (auto-detect format).
@@ -163,6 +508,62 @@ class LocatorParser:
         Returns:
             LocatorDictionary with extracted locators
         """
+        if self.cache is None:
+            return self._parse_file(file_path)
+        
+        with open(file_path, 'rb') as f:
+            digest = hashlib.sha256(_CACHE_SALT + f.read()).hexdigest()
+        cache_path = os.path.abspath(file_path)
+        
+        dictionary = self.cache.get(cache_path, digest, self.locator_type)
+        if dictionary is None:
+            dictionary = self._parse_file(file_path)
+            self.cache.put(cache_path, digest, self.locator_type, dictionary)
+        
+        self.dictionary = dictionary
+        return dictionary
+    
+    @classmethod
+    def parse_many(
+        cls,
+        file_paths: Sequence[str],
+        locator_type: LocatorType = LocatorType.PLAYWRIGHT,
+        cache: Optional[ParseCache] = None,
+        max_workers: Optional[int] = None
+    ) -> LocatorDictionary:
+        """Parse several locator files concurrently and merge the results.
+        
+        Parsing is CPU-bound pure Python with no state shared between files,
+        so files are fanned out to worker processes to sidestep the GIL.
+        Results are merged in the order given, so a later file's locator
+        wins on a name clash.
+        
+        Args:
+            file_paths: Paths to locator files (.py or .json)
+            locator_type: Type of locator framework (Playwright or Selenium)
+            cache: Optional persistent cache consulted by each worker
+            max_workers: Worker processes (default: one per CPU)
+            
+        Returns:
+            LocatorDictionary with the locators from every file
+        """
+        jobs = [(file_path, locator_type, cache) for file_path in file_paths]
+        
+        if len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                dictionaries = list(executor.map(_parse_one, jobs))
+        else:
+            dictionaries = [_parse_one(job) for job in jobs]
+        
+        merged = LocatorDictionary()
+        for dictionary in dictionaries:
+            for name, locator_info in dictionary.locators.items():
+                merged.add_locator(name, locator_info)
+        
+        return merged
+    
+    def _parse_file(self, file_path: str) -> LocatorDictionary:
+        """Parse a locator file by extension, bypassing the cache."""
         path = Path(file_path)
         
         if path.suffix == '.py':
@@ -180,24 +581,11 @@ class LocatorParser:
             submit_button -> submit
             loginForm -> login_form
         """
-        # Remove common suffixes
-        suffixes = ['_input', '_button', '_link', '_field', '_element', '_selector', '_locator']
-        for suffix in suffixes:
-            if name.endswith(suffix):
-                name = name[:-len(suffix)]
-                break
-        
-        # Convert camelCase to snake_case
-        name = re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
-        
-        # Clean up
-        name = name.replace('__', '_').strip('_')
-        
-        return name
+        return _normalize_name_cached(name)
     
     def _extract_locator_expr(self, node: ast.AST, source: str) -> str:
         """Extract locator expression from AST node using source code."""
-        # Fallback method if ast.unparse is not available
+        # Fallback method if ast.unparse fails on the node
         if isinstance(node, ast.Call):
             # Try to reconstruct the call
             if isinstance(node.func, ast.Attribute):
@@ -209,6 +597,10 @@ class LocatorParser:
         return "unknown_locator"
     
     def get_dictionary(self) -> LocatorDictionary:
-        """Get the current locator dictionary."""
+        """Get the dictionary returned by the most recent parse.
+        
+        Kept for compatibility; prefer the return value of the parse methods,
+        since each parse now builds a fresh dictionary.
+        """
         return self.dictionary
 
@@ -1,10 +1,292 @@
 """Generator for Python step definition files."""
 
 import re
-from typing import List, Dict
+from functools import lru_cache
+from typing import FrozenSet, List, Dict, Optional, Tuple
 from core.utils.models import BDDFeature, LocatorType, StepType
 
 
+# Building a step pattern: a quoted value, or a ${...} locator variable
+_STEP_TOKEN_RE = re.compile(r'("[^"]+")|\$\{[^}]+\}')
+
+# Escaping a built step pattern: a named group to keep, or a regex metachar
+_GROUP_OR_META_RE = re.compile(r'\(\?P<(\w+)>[^)]+\)|[.*+?^$()|[\]\\]')
+
+# Escaping raw step text: a ${...} variable, a quoted value, or a regex metachar
+_VAR_QUOTE_OR_META_RE = re.compile(r'(\$\{[^}]+\})|("[^"]+")|[.*+?^$()|[\]\\]')
+
+
+def _step_token_group(match: "re.Match[str]") -> str:
+    """Replacement for _STEP_TOKEN_RE matches."""
+    if match.group(1):
+        return r'"(?P<value>[^"]+)"'
+    return r'(?P<locator>[^\s]+)'
+
+
+def _escape_group_or_meta(match: "re.Match[str]") -> str:
+    """Replacement for _GROUP_OR_META_RE matches."""
+    group_name = match.group(1)
+    if group_name is None:
+        return '\\' + match.group()
+    if group_name in ('locator', 'value'):
+        return f'(?P<{group_name}>[^\\s]+)'
+    return match.group()
+
+
+def _escape_var_quote_or_meta(match: "re.Match[str]") -> str:
+    """Replacement for _VAR_QUOTE_OR_META_RE matches."""
+    if match.group(1):
+        return r'\$\{(?P<locator>[^\s]+)\}'
+    if match.group(2):
+        return r'"(?P<value>[^"]+)"'
+    return '\\' + match.group()
+
+
+# Lower-cased pattern bucket per step type, computed once instead of per step
+_STEP_TYPE_KEYS = {step_type: step_type.value.lower() for step_type in StepType}
+
+# Every step classification keyword. The lookahead reports all keyword
+# occurrences (even overlapping ones) in a single case-insensitive scan.
+_STEP_KEYWORD_RE = re.compile(
+    r'(?=(on the|navigate|enter|fill|type|click|press|select|see|verify|check))',
+    re.IGNORECASE
+)
+
+# Step kinds per generator as (kind, keywords) in priority order; the first
+# kind with any keyword present in the pattern wins
+_NAVIGATE_KINDS = (('navigate', frozenset({'on the', 'navigate'})),)
+_PLAYWRIGHT_WHEN_KINDS = (
+    ('enter', frozenset({'enter', 'fill', 'type'})),
+    ('click', frozenset({'click', 'press'})),
+    ('select', frozenset({'select'})),
+)
+_PLAYWRIGHT_THEN_KINDS = (('verify', frozenset({'see', 'verify', 'check'})),)
+_SELENIUM_WHEN_KINDS = (
+    ('enter', frozenset({'enter', 'fill'})),
+    ('click', frozenset({'click'})),
+)
+_SELENIUM_THEN_KINDS = (('verify', frozenset({'see', 'verify'})),)
+
+
+@lru_cache(maxsize=1024)
+def _step_keywords(pattern: str) -> FrozenSet[str]:
+    """Return every classification keyword contained in a step pattern."""
+    return frozenset(match.group(1).lower() for match in _STEP_KEYWORD_RE.finditer(pattern))
+
+
+def _classify_step(
+    pattern: str,
+    kinds: Tuple[Tuple[str, FrozenSet[str]], ...]
+) -> Optional[str]:
+    """Classify a step pattern.
+    
+    Args:
+        pattern: Step pattern
+        kinds: (kind, keywords) pairs in priority order
+        
+    Returns:
+        The first kind whose keywords occur in the pattern, or None
+    """
+    keywords = _step_keywords(pattern)
+    for kind, kind_keywords in kinds:
+        if keywords & kind_keywords:
+            return kind
+    return None
+
+
+# Step definition templates; %s is the escaped step pattern. Each ends with
+# a newline, which stands in for the blank line between definitions.
+_PLAYWRIGHT_GIVEN_NAVIGATE_TMPL = (
+    '@given(parsers.re(r"""^%s$"""))\n'
+    'def step_given_navigate(page):\n'
+    '    """Navigate to a page."""\n'
+    '    # Implement navigation logic\n'
+    '    # Example: page.goto("https://example.com/login")\n'
+    '    pass\n'
+)
+
+_PLAYWRIGHT_WHEN_ENTER_TEXT_TMPL = (
+    '@when(parsers.re(r"""^%s$"""))\n'
+    'def step_when_enter_text(page, locator=None, value=None):\n'
+    '    """Enter text into a field."""\n'
+    '    if locator:\n'
+    '        # Extract locator variable\n'
+    '        if locator.startswith("${") and locator.endswith("}"):\n'
+    '            locator_var = locator[2:-1].split(".")[-1]\n'
+    '            # Get element from page object\n'
+    '            # element = getattr(page, locator_var, None)\n'
+    '            # if element and value:\n'
+    '            #     element.fill(value)\n'
+    '            # For now, use direct locator\n'
+    '            page.locator(f"#{locator_var}").fill(value or "test_value")\n'
+    '    pass\n'
+)
+
+_PLAYWRIGHT_WHEN_CLICK_TMPL = (
+    '@when(parsers.re(r"""^%s$"""))\n'
+    'def step_when_click(page, locator=None):\n'
+    '    """Click on an element."""\n'
+    '    if locator:\n'
+    '        if locator.startswith("${") and locator.endswith("}"):\n'
+    '            locator_var = locator[2:-1].split(".")[-1]\n'
+    '            # Get element from page object\n'
+    '            # element = getattr(page, locator_var, None)\n'
+    '            # if element:\n'
+    '            #     element.click()\n'
+    '            # For now, use direct locator\n'
+    '            page.locator(f"#{locator_var}").click()\n'
+    '    pass\n'
+)
+
+_PLAYWRIGHT_WHEN_SELECT_TMPL = (
+    '@when(parsers.re(r"""^%s$"""))\n'
+    'def step_when_select(page, locator=None, value=None):\n'
+    '    """Select an option."""\n'
+    '    if locator and value:\n'
+    '        if locator.startswith("${") and locator.endswith("}"):\n'
+    '            locator_var = locator[2:-1].split(".")[-1]\n'
+    '            # Get element from page object\n'
+    '            # element = getattr(page, locator_var, None)\n'
+    '            # if element:\n'
+    '            #     element.select_option(value)\n'
+    '            # For now, use direct locator\n'
+    '            page.locator(f"#{locator_var}").select_option(value)\n'
+    '    pass\n'
+)
+
+_PLAYWRIGHT_THEN_VERIFY_TMPL = (
+    '@then(parsers.re(r"""^%s$"""))\n'
+    'def step_then_verify(page, locator=None, value=None):\n'
+    '    """Verify an element or text is visible."""\n'
+    '    if locator and locator.startswith("${") and locator.endswith("}"):\n'
+    '        locator_var = locator[2:-1].split(".")[-1]\n'
+    '        # Get element from page object\n'
+    '        # element = getattr(page, locator_var, None)\n'
+    '        # if element:\n'
+    '        #     expect(element).to_be_visible()\n'
+    '        # For now, use direct locator\n'
+    '        expect(page.locator(f"#{locator_var}")).to_be_visible()\n'
+    '    elif value:\n'
+    '        # Check for text content\n'
+    '        expect(page.locator(f"text={value}")).to_be_visible()\n'
+    '    pass\n'
+)
+
+_SELENIUM_GIVEN_NAVIGATE_TMPL = (
+    '@given(parsers.re(r"""^%s$"""))\n'
+    'def step_given_navigate(driver):\n'
+    '    """Navigate to a page."""\n'
+    '    # Implement navigation logic\n'
+    '    # Example: driver.get("https://example.com/login")\n'
+    '    pass\n'
+)
+
+_SELENIUM_WHEN_ENTER_TEXT_TMPL = (
+    '@when(parsers.re(r"""^%s$"""))\n'
+    'def step_when_enter_text(driver, locator=None, value=None):\n'
+    '    """Enter text into a field."""\n'
+    '    if locator:\n'
+    '        if locator.startswith("${") and locator.endswith("}"):\n'
+    '            locator_var = locator[2:-1].split(".")[-1]\n'
+    '            element = driver.find_element(By.ID, locator_var)\n'
+    '            if element and value:\n'
+    '                element.send_keys(value)\n'
+    '    pass\n'
+)
+
+_SELENIUM_WHEN_CLICK_TMPL = (
+    '@when(parsers.re(r"""^%s$"""))\n'
+    'def step_when_click(driver, locator=None):\n'
+    '    """Click on an element."""\n'
+    '    if locator:\n'
+    '        if locator.startswith("${") and locator.endswith("}"):\n'
+    '            locator_var = locator[2:-1].split(".")[-1]\n'
+    '            element = driver.find_element(By.ID, locator_var)\n'
+    '            if element:\n'
+    '                element.click()\n'
+    '    pass\n'
+)
+
+_SELENIUM_THEN_VERIFY_TMPL = (
+    '@then(parsers.re(r"""^%s$"""))\n'
+    'def step_then_verify(driver, locator=None, value=None):\n'
+    '    """Verify an element or text is visible."""\n'
+    '    if locator:\n'
+    '        if locator.startswith("${") and locator.endswith("}"):\n'
+    '            locator_var = locator[2:-1].split(".")[-1]\n'
+    '            element = driver.find_element(By.ID, locator_var)\n'
+    '            assert element.is_displayed()\n'
+    '    elif value:\n'
+    '        assert value in driver.page_source\n'
+    '    pass\n'
+)
+
+
+# Fixed module preambles (imports and fixtures), joined once at import;
+# the generated step definitions are appended after them.
+_PLAYWRIGHT_HEADER = '\n'.join([
+    '"""Auto-generated step definitions for Playwright using pytest-bdd."""',
+    '',
+    'import pytest',
+    'from pytest_bdd import given, when, then, parsers',
+    'from playwright.sync_api import Page, expect, sync_playwright',
+    '',
+    '',
+    '# ===== Fixtures =====',
+    '',
+    '@pytest.fixture(scope="session")',
+    'def playwright():',
+    '    """Initialize Playwright."""',
+    '    with sync_playwright() as p:',
+    '        yield p',
+    '',
+    '',
+    '@pytest.fixture(scope="session")',
+    'def browser(playwright):',
+    '    """Get browser instance."""',
+    '    browser = playwright.chromium.launch(headless=True)',
+    '    yield browser',
+    '    browser.close()',
+    '',
+    '',
+    '@pytest.fixture',
+    'def page(browser):',
+    '    """Get Playwright page fixture."""',
+    '    page = browser.new_page()',
+    '    yield page',
+    '    page.close()',
+    '',
+    '',
+    '# ===== Given Steps =====',
+    ''
+])
+
+
+_SELENIUM_HEADER = '\n'.join([
+    '"""Auto-generated step definitions for Selenium using pytest-bdd."""',
+    '',
+    'import pytest',
+    'from pytest_bdd import given, when, then, parsers',
+    'from selenium.webdriver.common.by import By',
+    'from selenium.webdriver.support.ui import WebDriverWait',
+    'from selenium.webdriver.support import expected_conditions as EC',
+    '',
+    '',
+    '# ===== Fixtures =====',
+    '',
+    '@pytest.fixture',
+    'def driver(browser):',
+    '    """Get Selenium WebDriver fixture."""',
+    '    # Initialize WebDriver',
+    '    # This should be customized based on your setup',
+    '    return browser',
+    '',
+    '',
+    '# ===== Given Steps =====',
+    ''
+])
+
+
 class StepDefinitionGenerator:
     """Generates Python step definition code."""
     
@@ -12,9 +294,10 @@ class StepDefinitionGenerator:
         """Initialize the generator.
         
         Args:
-            framework: Framework type (Playwright or Selenium)
+            framework: Framework type (Playwright or Selenium), or its value
         """
-        self.framework = framework
+        # Coerced to the canonical member so dispatch is an identity check
+        self.framework = LocatorType(framework)
     
     def generate(self, feature: BDDFeature) -> str:
         """Generate step definition file content.
@@ -25,7 +308,7 @@ class StepDefinitionGenerator:
         Returns:
             Python code as string
         """
-        if self.framework == LocatorType.PLAYWRIGHT:
+        if self.framework is LocatorType.PLAYWRIGHT:
             return self._generate_playwright_steps(feature)
         else:
             return self._generate_selenium_steps(feature)
@@ -39,51 +322,16 @@ class StepDefinitionGenerator:
         Returns:
             Python code
         """
-        code_lines = [
-            '"""Auto-generated step definitions for Playwright using pytest-bdd."""',
-            '',
-            'import pytest',
-            'from pytest_bdd import given, when, then, parsers',
-            'from playwright.sync_api import Page, expect, sync_playwright',
-            '',
-            '',
-            '# ===== Fixtures =====',
-            '',
-            '@pytest.fixture(scope="session")',
-            'def playwright():',
-            '    """Initialize Playwright."""',
-            '    with sync_playwright() as p:',
-            '        yield p',
-            '',
-            '',
-            '@pytest.fixture(scope="session")',
-            'def browser(playwright):',
-            '    """Get browser instance."""',
-            '    browser = playwright.chromium.launch(headless=True)',
-            '    yield browser',
-            '    browser.close()',
-            '',
-            '',
-            '@pytest.fixture',
-            'def page(browser):',
-            '    """Get Playwright page fixture."""',
-            '    page = browser.new_page()',
-            '    yield page',
-            '    page.close()',
-            '',
-            '',
-            '# ===== Given Steps =====',
-            ''
-        ]
+        code_lines = [_PLAYWRIGHT_HEADER]
         
         # Collect unique step patterns
         step_patterns = self._extract_step_patterns(feature)
         
         # Generate step definitions by type
-        code_lines.extend(self._generate_given_steps(step_patterns.get('given', [])))
-        code_lines.extend(self._generate_when_steps(step_patterns.get('when', [])))
-        code_lines.extend(self._generate_then_steps(step_patterns.get('then', [])))
-        code_lines.extend(self._generate_and_steps(step_patterns.get('and', [])))
+        self._generate_given_steps(step_patterns.get('given', []), code_lines)
+        self._generate_when_steps(step_patterns.get('when', []), code_lines)
+        self._generate_then_steps(step_patterns.get('then', []), code_lines)
+        self._generate_and_steps(step_patterns.get('and', []), code_lines)
         
         return '\n'.join(code_lines)
     
@@ -96,38 +344,16 @@ class StepDefinitionGenerator:
         Returns:
             Python code
         """
-        code_lines = [
-            '"""Auto-generated step definitions for Selenium using pytest-bdd."""',
-            '',
-            'import pytest',
-            'from pytest_bdd import given, when, then, parsers',
-            'from selenium.webdriver.common.by import By',
-            'from selenium.webdriver.support.ui import WebDriverWait',
-            'from selenium.webdriver.support import expected_conditions as EC',
-            '',
-            '',
-            '# ===== Fixtures =====',
-            '',
-            '@pytest.fixture',
-            'def driver(browser):',
-            '    """Get Selenium WebDriver fixture."""',
-            '    # Initialize WebDriver',
-            '    # This should be customized based on your setup',
-            '    return browser',
-            '',
-            '',
-            '# ===== Given Steps =====',
-            ''
-        ]
+        code_lines = [_SELENIUM_HEADER]
         
         # Collect unique step patterns
         step_patterns = self._extract_step_patterns(feature)
         
         # Generate step definitions by type
-        code_lines.extend(self._generate_given_steps_selenium(step_patterns.get('given', [])))
-        code_lines.extend(self._generate_when_steps_selenium(step_patterns.get('when', [])))
-        code_lines.extend(self._generate_then_steps_selenium(step_patterns.get('then', [])))
-        code_lines.extend(self._generate_and_steps_selenium(step_patterns.get('and', [])))
+        self._generate_given_steps_selenium(step_patterns.get('given', []), code_lines)
+        self._generate_when_steps_selenium(step_patterns.get('when', []), code_lines)
+        self._generate_then_steps_selenium(step_patterns.get('then', []), code_lines)
+        self._generate_and_steps_selenium(step_patterns.get('and', []), code_lines)
         
         return '\n'.join(code_lines)
     
@@ -140,19 +366,23 @@ class StepDefinitionGenerator:
         Returns:
             Dictionary of step patterns by type
         """
-        patterns = {
-            'given': [],
-            'when': [],
-            'then': [],
-            'and': []
+        # Sets give O(1) membership checks; the lists keep first-seen order
+        seen = {
+            'given': set(),
+            'when': set(),
+            'then': set(),
+            'and': set()
         }
+        patterns = {step_type: [] for step_type in seen}
         
         for scenario in feature.scenarios:
             for step in scenario.steps:
-                step_type = step.step_type.value.lower()
+                step_type = _STEP_TYPE_KEYS[step.step_type]
                 pattern = self._create_step_pattern(step.text)
                 
-                if pattern not in patterns[step_type]:
+                seen_patterns = seen[step_type]
+                if pattern not in seen_patterns:
+                    seen_patterns.add(pattern)
                     patterns[step_type].append(pattern)
         
         return patterns
@@ -166,245 +396,104 @@ class StepDefinitionGenerator:
         Returns:
             Regex pattern string
         """
-        # Replace locator variables with regex groups
-        pattern = step_text
-        
-        # Replace ${...} with regex group that matches any non-whitespace
-        # Use [^\\s]+ (double backslash) so it becomes [^\s]+ in the final string
-        pattern = re.sub(r'\$\{[^}]+\}', r'(?P<locator>[^\\s]+)', pattern)
-        
-        # Replace quoted strings with regex groups
-        pattern = re.sub(r'"([^"]+)"', r'"(?P<value>[^"]+)"', pattern)
-        
-        # Escape special regex characters but keep our groups
-        # This is simplified - in production, more sophisticated pattern generation
-        
-        return pattern
+        # Replace ${...} variables and quoted strings with regex groups in a
+        # single scan. A quote is tried first at each position, so a quoted
+        # string containing a variable becomes one value group, matching
+        # what substituting variables and then quotes used to produce.
+        return _STEP_TOKEN_RE.sub(_step_token_group, step_text)
     
-    def _generate_given_steps(self, patterns: List[str]) -> List[str]:
+    def _generate_given_steps(self, patterns: List[str], out: List[str]) -> None:
         """Generate Given step definitions for Playwright with pytest-bdd."""
-        lines = []
-        
         for pattern in patterns:
-            if 'on the' in pattern.lower() or 'navigate' in pattern.lower():
+            if _classify_step(pattern, _NAVIGATE_KINDS) == 'navigate':
                 escaped = self._escape_pattern(pattern)
-                lines.extend([
-                    f'@given(parsers.re(r"""^{escaped}$"""))',
-                    'def step_given_navigate(page):',
-                    '    """Navigate to a page."""',
-                    '    # Implement navigation logic',
-                    '    # Example: page.goto("https://example.com/login")',
-                    '    pass',
-                    '',
-                ])
-        
-        return lines
+                out.append(_PLAYWRIGHT_GIVEN_NAVIGATE_TMPL % escaped)
     
-    def _generate_when_steps(self, patterns: List[str]) -> List[str]:
+    def _generate_when_steps(self, patterns: List[str], out: List[str]) -> None:
         """Generate When step definitions for Playwright."""
-        lines = [
+        out.extend((
             '',
             '# ===== When Steps =====',
             ''
-        ]
+        ))
         
         for pattern in patterns:
-            if 'enter' in pattern.lower() or 'fill' in pattern.lower() or 'type' in pattern.lower():
+            kind = _classify_step(pattern, _PLAYWRIGHT_WHEN_KINDS)
+            if kind == 'enter':
                 escaped = self._escape_pattern(pattern)
                 # Use triple quotes to avoid escaping issues
-                lines.extend([
-                    f'@when(parsers.re(r"""^{escaped}$"""))',
-                    'def step_when_enter_text(page, locator=None, value=None):',
-                    '    """Enter text into a field."""',
-                    '    if locator:',
-                    '        # Extract locator variable',
-                    '        if locator.startswith("${") and locator.endswith("}"):',
-                    '            locator_var = locator[2:-1].split(".")[-1]',
-                    '            # Get element from page object',
-                    '            # element = getattr(page, locator_var, None)',
-                    '            # if element and value:',
-                    '            #     element.fill(value)',
-                    '            # For now, use direct locator',
-                    '            page.locator(f"#{locator_var}").fill(value or "test_value")',
-                    '    pass',
-                    '',
-                ])
-            elif 'click' in pattern.lower() or 'press' in pattern.lower():
+                out.append(_PLAYWRIGHT_WHEN_ENTER_TEXT_TMPL % escaped)
+            elif kind == 'click':
                 escaped = self._escape_pattern(pattern)
-                lines.extend([
-                    f'@when(parsers.re(r"""^{escaped}$"""))',
-                    'def step_when_click(page, locator=None):',
-                    '    """Click on an element."""',
-                    '    if locator:',
-                    '        if locator.startswith("${") and locator.endswith("}"):',
-                    '            locator_var = locator[2:-1].split(".")[-1]',
-                    '            # Get element from page object',
-                    '            # element = getattr(page, locator_var, None)',
-                    '            # if element:',
-                    '            #     element.click()',
-                    '            # For now, use direct locator',
-                    '            page.locator(f"#{locator_var}").click()',
-                    '    pass',
-                    '',
-                ])
-            elif 'select' in pattern.lower():
+                out.append(_PLAYWRIGHT_WHEN_CLICK_TMPL % escaped)
+            elif kind == 'select':
                 escaped = self._escape_pattern(pattern)
-                lines.extend([
-                    f'@when(parsers.re(r"""^{escaped}$"""))',
-                    'def step_when_select(page, locator=None, value=None):',
-                    '    """Select an option."""',
-                    '    if locator and value:',
-                    '        if locator.startswith("${") and locator.endswith("}"):',
-                    '            locator_var = locator[2:-1].split(".")[-1]',
-                    '            # Get element from page object',
-                    '            # element = getattr(page, locator_var, None)',
-                    '            # if element:',
-                    '            #     element.select_option(value)',
-                    '            # For now, use direct locator',
-                    '            page.locator(f"#{locator_var}").select_option(value)',
-                    '    pass',
-                    '',
-                ])
-        
-        return lines
+                out.append(_PLAYWRIGHT_WHEN_SELECT_TMPL % escaped)
     
-    def _generate_then_steps(self, patterns: List[str]) -> List[str]:
+    def _generate_then_steps(self, patterns: List[str], out: List[str]) -> None:
         """Generate Then step definitions for Playwright."""
-        lines = [
+        out.extend((
             '',
             '# ===== Then Steps =====',
             ''
-        ]
+        ))
         
         for pattern in patterns:
-            if 'see' in pattern.lower() or 'verify' in pattern.lower() or 'check' in pattern.lower():
+            if _classify_step(pattern, _PLAYWRIGHT_THEN_KINDS) == 'verify':
                 escaped = self._escape_pattern(pattern)
-                lines.extend([
-                    f'@then(parsers.re(r"""^{escaped}$"""))',
-                    'def step_then_verify(page, locator=None, value=None):',
-                    '    """Verify an element or text is visible."""',
-                    '    if locator and locator.startswith("${") and locator.endswith("}"):',
-                    '        locator_var = locator[2:-1].split(".")[-1]',
-                    '        # Get element from page object',
-                    '        # element = getattr(page, locator_var, None)',
-                    '        # if element:',
-                    '        #     expect(element).to_be_visible()',
-                    '        # For now, use direct locator',
-                    '        expect(page.locator(f"#{locator_var}")).to_be_visible()',
-                    '    elif value:',
-                    '        # Check for text content',
-                    '        expect(page.locator(f"text={value}")).to_be_visible()',
-                    '    pass',
-                    '',
-                ])
-        
-        return lines
+                out.append(_PLAYWRIGHT_THEN_VERIFY_TMPL % escaped)
     
-    def _generate_and_steps(self, patterns: List[str]) -> List[str]:
+    def _generate_and_steps(self, patterns: List[str], out: List[str]) -> None:
         """Generate And step definitions for Playwright with pytest-bdd."""
-        lines = [
+        out.extend((
             '',
             '# ===== And Steps =====',
             '',
             '# Note: pytest-bdd handles "And" steps automatically by reusing',
             '# the same step definitions. No separate handler needed.',
             ''
-        ]
-        
-        return lines
+        ))
     
-    def _generate_given_steps_selenium(self, patterns: List[str]) -> List[str]:
+    def _generate_given_steps_selenium(self, patterns: List[str], out: List[str]) -> None:
         """Generate Given step definitions for Selenium with pytest-bdd."""
-        lines = []
-        
         for pattern in patterns:
-            if 'on the' in pattern.lower() or 'navigate' in pattern.lower():
+            if _classify_step(pattern, _NAVIGATE_KINDS) == 'navigate':
                 escaped = self._escape_pattern(pattern)
-                lines.extend([
-                    f'@given(parsers.re(r"""^{escaped}$"""))',
-                    'def step_given_navigate(driver):',
-                    '    """Navigate to a page."""',
-                    '    # Implement navigation logic',
-                    '    # Example: driver.get("https://example.com/login")',
-                    '    pass',
-                    '',
-                ])
-        
-        return lines
+                out.append(_SELENIUM_GIVEN_NAVIGATE_TMPL % escaped)
     
-    def _generate_when_steps_selenium(self, patterns: List[str]) -> List[str]:
+    def _generate_when_steps_selenium(self, patterns: List[str], out: List[str]) -> None:
         """Generate When step definitions for Selenium."""
-        lines = [
+        out.extend((
             '',
             '# ===== When Steps =====',
             ''
-        ]
+        ))
         
         for pattern in patterns:
-            if 'enter' in pattern.lower() or 'fill' in pattern.lower():
+            kind = _classify_step(pattern, _SELENIUM_WHEN_KINDS)
+            if kind == 'enter':
                 escaped = self._escape_pattern(pattern)
-                lines.extend([
-                    f'@when(parsers.re(r"""^{escaped}$"""))',
-                    'def step_when_enter_text(driver, locator=None, value=None):',
-                    '    """Enter text into a field."""',
-                    '    if locator:',
-                    '        if locator.startswith("${") and locator.endswith("}"):',
-                    '            locator_var = locator[2:-1].split(".")[-1]',
-                    '            element = driver.find_element(By.ID, locator_var)',
-                    '            if element and value:',
-                    '                element.send_keys(value)',
-                    '    pass',
-                    '',
-                ])
-            elif 'click' in pattern.lower():
+                out.append(_SELENIUM_WHEN_ENTER_TEXT_TMPL % escaped)
+            elif kind == 'click':
                 escaped = self._escape_pattern(pattern)
-                lines.extend([
-                    f'@when(parsers.re(r"""^{escaped}$"""))',
-                    'def step_when_click(driver, locator=None):',
-                    '    """Click on an element."""',
-                    '    if locator:',
-                    '        if locator.startswith("${") and locator.endswith("}"):',
-                    '            locator_var = locator[2:-1].split(".")[-1]',
-                    '            element = driver.find_element(By.ID, locator_var)',
-                    '            if element:',
-                    '                element.click()',
-                    '    pass',
-                    '',
-                ])
-        
-        return lines
+                out.append(_SELENIUM_WHEN_CLICK_TMPL % escaped)
     
-    def _generate_then_steps_selenium(self, patterns: List[str]) -> List[str]:
+    def _generate_then_steps_selenium(self, patterns: List[str], out: List[str]) -> None:
         """Generate Then step definitions for Selenium."""
-        lines = [
+        out.extend((
             '',
             '# ===== Then Steps =====',
             ''
-        ]
+        ))
         
         for pattern in patterns:
-            if 'see' in pattern.lower() or 'verify' in pattern.lower():
+            if _classify_step(pattern, _SELENIUM_THEN_KINDS) == 'verify':
                 escaped = self._escape_pattern(pattern)
-                lines.extend([
-                    f'@then(parsers.re(r"""^{escaped}$"""))',
-                    'def step_then_verify(driver, locator=None, value=None):',
-                    '    """Verify an element or text is visible."""',
-                    '    if locator:',
-                    '        if locator.startswith("${") and locator.endswith("}"):',
-                    '            locator_var = locator[2:-1].split(".")[-1]',
-                    '            element = driver.find_element(By.ID, locator_var)',
-                    '            assert element.is_displayed()',
-                    '    elif value:',
-                    '        assert value in driver.page_source',
-                    '    pass',
-                    '',
-                ])
-        
-        return lines
+                out.append(_SELENIUM_THEN_VERIFY_TMPL % escaped)
     
-    def _generate_and_steps_selenium(self, patterns: List[str]) -> List[str]:
+    def _generate_and_steps_selenium(self, patterns: List[str], out: List[str]) -> None:
         """Generate And step definitions for Selenium with pytest-bdd."""
-        return self._generate_and_steps(patterns)
+        self._generate_and_steps(patterns, out)
     
     def _escape_pattern(self, pattern: str) -> str:
         """Escape special characters in pattern for regex.
@@ -416,31 +505,15 @@ class StepDefinitionGenerator:
             Escaped pattern
         """
         # Check if pattern already has regex groups (from _create_step_pattern)
-        # If it has (?P<...>), we need to preserve those groups
+        # If it has (?P<...>), we need to preserve those groups. Either way a
+        # single substitution pass classifies each match and emits its
+        # escaped form directly.
         if '(?P<' in pattern:
-            # Pattern already has regex groups, just escape special chars around them
-            # Replace regex groups with placeholders temporarily
-            pattern = re.sub(r'\(\?P<(\w+)>([^)]+)\)', r'__REGEX_GROUP_\1__', pattern)
-            pattern = re.sub(r'"\(\?P<(\w+)>([^)]+)\)"', r'__QUOTED_GROUP_\1__', pattern)
-            
-            # Escape special regex characters (but not our placeholders)
-            pattern = re.sub(r'([.*+?^$()|[\]\\])', r'\\\1', pattern)
-            
-            # Restore regex groups (they're already properly formatted)
-            for group_name in ['locator', 'value']:
-                pattern = pattern.replace(f'__REGEX_GROUP_{group_name}__', f'(?P<{group_name}>[^\\s]+)')
-                pattern = pattern.replace(f'__QUOTED_GROUP_{group_name}__', f'"(?P<{group_name}>[^"]+)"')
+            # Keep regex groups, escape special chars around them
+            pattern = _GROUP_OR_META_RE.sub(_escape_group_or_meta, pattern)
         else:
-            # Pattern has ${...} format, convert to regex groups
-            pattern = re.sub(r'\$\{([^}]+)\}', r'__LOCATOR_PLACEHOLDER__', pattern)
-            pattern = re.sub(r'"([^"]+)"', r'__VALUE_PLACEHOLDER__', pattern)
-            
-            # Escape special regex characters
-            pattern = re.sub(r'([.*+?^$()|[\]\\])', r'\\\1', pattern)
-            
-            # Restore with regex groups and ${} format
-            pattern = pattern.replace('__LOCATOR_PLACEHOLDER__', r'\$\{(?P<locator>[^\s]+)\}')
-            pattern = pattern.replace('__VALUE_PLACEHOLDER__', r'"(?P<value>[^"]+)"')
+            # Convert ${...} and quoted values to regex groups, escape the rest
+            pattern = _VAR_QUOTE_OR_META_RE.sub(_escape_var_quote_or_meta, pattern)
         
         return pattern
 
@@ -0,0 +1,62 @@
+"""Bit-parallel Levenshtein distance (Myers / Hyyrö)."""
+
+from typing import Dict, Optional
+
+
+def levenshtein(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """Compute the Levenshtein distance between two strings.
+    
+    Uses Myers' bit-vector algorithm: one column of the DP matrix is held
+    as bit vectors in Python ints, so each character of ``a`` costs a
+    handful of word operations instead of a loop over ``b``. Names up to
+    64 characters fit in a single machine word.
+    
+    Args:
+        a: First string
+        b: Second string
+        max_distance: If given, any distance above it may be reported as
+            max_distance + 1 without being computed exactly
+    
+    Returns:
+        Edit distance (insertions, deletions and substitutions)
+    """
+    # Bit vectors span the shorter string
+    if len(a) < len(b):
+        a, b = b, a
+    
+    m = len(b)
+    if max_distance is not None and len(a) - m > max_distance:
+        return max_distance + 1
+    if m == 0:
+        return len(a)
+    
+    # Per-character match masks of b
+    peq: Dict[str, int] = {}
+    for i, char in enumerate(b):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv = full  # vertical +1 deltas
+    mv = 0     # vertical -1 deltas
+    score = m
+    
+    for char in a:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & full
+        mh = pv & xh
+        
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        
+        # Global distance: the top row grows by one per column
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv
+    
+    return score
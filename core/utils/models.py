@@ -1,9 +1,23 @@
 """Pydantic models for SmartFusionAI data structures."""
 
+import sys
+from collections import deque
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 from enum import Enum
 
+from core.utils.edit_distance import levenshtein
+
+
+# Build validators/serializers on first use instead of at import time, so
+# importing the package (e.g. for ``main.py --help``) skips schema building
+# for models a run may never touch
+_DEFERRED = ConfigDict(defer_build=True)
+
+# Same, for models that are never modified once built. Frozen instances
+# can be shared safely (the mapper reuses results for repeated steps)
+_DEFERRED_FROZEN = ConfigDict(defer_build=True, frozen=True)
+
 
 class StepType(str, Enum):
     """BDD step types."""
@@ -22,35 +36,239 @@ class LocatorType(str, Enum):
 
 class LocatorInfo(BaseModel):
     """Information about a locator."""
+    model_config = ConfigDict(frozen=True)
+    
     variable_name: str = Field(..., description="Variable name (e.g., self.user_name_input)")
     locator_expression: str = Field(..., description="Locator expression (e.g., page.locator('#username'))")
     normalized_name: str = Field(..., description="Normalized element name (e.g., user_name)")
     locator_type: LocatorType = Field(default=LocatorType.PLAYWRIGHT)
+    
+    @field_validator('variable_name', 'normalized_name', mode='before')
+    @classmethod
+    def _intern_name(cls, value: Any) -> Any:
+        """Intern names so every copy (mapped steps, reports) shares one string."""
+        return sys.intern(value) if isinstance(value, str) else value
 
 
 class LocatorDictionary(BaseModel):
     """Dictionary mapping normalized names to locator info."""
+    model_config = _DEFERRED
+    
     locators: Dict[str, LocatorInfo] = Field(default_factory=dict)
     
+    # Parallel per-field lists (struct-of-arrays) kept in step with
+    # ``locators`` so bulk passes iterate flat lists of strings instead of
+    # hopping through each LocatorInfo; _index maps a name to its slot
+    _names: List[str] = PrivateAttr(default_factory=list)
+    _variable_names: List[str] = PrivateAttr(default_factory=list)
+    _expressions: List[str] = PrivateAttr(default_factory=list)
+    _index: Dict[str, int] = PrivateAttr(default_factory=dict)
+    
+    # Indexes over lower-cased names for find_partial_match, built lazily by
+    # _index_tries: most dictionaries are parsed, cached or serialized
+    # without ever being partially matched. _trie_size counts indexed slots.
+    #
+    # _suffix_trie holds every suffix of every name. Nodes are dicts keyed
+    # by character; the None key holds the earliest slot through the node.
+    _suffix_trie: Dict[Any, Any] = PrivateAttr(default_factory=dict)
+    _trie_size: int = PrivateAttr(default=0)
+    
+    # Aho-Corasick automaton over whole names, as parallel lists indexed by
+    # node (0 is the root): goto edges, failure links, and the earliest
+    # slot of any name ending at the node or along its failure chain. One
+    # pass over a token finds every name occurring inside it.
+    _name_goto: List[Dict[str, int]] = PrivateAttr(default_factory=lambda: [{}])  # type: ignore[arg-type]
+    _name_fail: List[int] = PrivateAttr(default_factory=lambda: [0])
+    _name_out: List[Optional[int]] = PrivateAttr(default_factory=lambda: [None])  # type: ignore[arg-type]
+    
+    # Memoized find_partial_match results by token; tokens recur across
+    # scenarios and features, and a batch run reuses one dictionary
+    _partial_cache: Dict[str, Optional[str]] = PrivateAttr(default_factory=dict)
+    _fuzzy_cache: Dict[Any, Optional[str]] = PrivateAttr(default_factory=dict)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Build the parallel lists for locators passed to the constructor."""
+        for name, locator_info in self.locators.items():
+            self._append_columns(name, locator_info)
+    
+    def _append_columns(self, normalized_name: str, locator_info: LocatorInfo):
+        """Append a locator to the parallel lists."""
+        self._index[normalized_name] = len(self._names)
+        self._names.append(normalized_name)
+        self._variable_names.append(locator_info.variable_name)
+        self._expressions.append(locator_info.locator_expression)
+    
+    def _index_tries(self):
+        """Index names added since the last call for partial matching."""
+        size = len(self._names)
+        for slot in range(self._trie_size, size):
+            # Slots only grow, so setdefault keeps the earliest one per node
+            lowered = self._names[slot].lower()
+            self._suffix_trie.setdefault(None, slot)
+            for start in range(len(lowered)):
+                node = self._suffix_trie
+                for char in lowered[start:]:
+                    node = node.setdefault(char, {})
+                    node.setdefault(None, slot)
+        
+        self._build_name_automaton()
+        
+        # Published last: scenario mapping threads skip indexing once the
+        # size is current, so both structures must be complete by then
+        self._trie_size = size
+    
+    def _build_name_automaton(self):
+        """Rebuild the Aho-Corasick automaton over all names."""
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Optional[int]] = [None]
+        
+        for slot, name in enumerate(self._names):
+            node = 0
+            for char in name.lower():
+                child = goto[node].get(char)
+                if child is None:
+                    child = goto[node][char] = len(goto)
+                    goto.append({})
+                    out.append(None)
+                node = child
+            if out[node] is None:
+                out[node] = slot
+        
+        # Breadth-first, so a node's failure target is final before its
+        # children are linked; each node inherits the earliest output slot
+        # along its failure chain
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        for child in queue:
+            if out[child] is None or (out[0] is not None and out[0] < out[child]):
+                out[child] = out[0]
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                target = fail[node]
+                while target and char not in goto[target]:
+                    target = fail[target]
+                target = goto[target].get(char, 0)
+                fail[child] = target
+                if out[child] is None or (out[target] is not None and out[target] < out[child]):
+                    out[child] = out[target]
+                queue.append(child)
+        
+        self._name_goto = goto
+        self._name_fail = fail
+        self._name_out = out
+    
     def add_locator(self, normalized_name: str, locator_info: LocatorInfo):
         """Add a locator to the dictionary."""
+        normalized_name = sys.intern(normalized_name)
         self.locators[normalized_name] = locator_info
+        
+        slot = self._index.get(normalized_name)
+        if slot is None:
+            self._append_columns(normalized_name, locator_info)
+            # A new name can change partial matches; replacing an existing
+            # one cannot, since results are names
+            self._partial_cache.clear()
+            self._fuzzy_cache.clear()
+        else:
+            # Replacing keeps the dict's original insertion position
+            self._variable_names[slot] = locator_info.variable_name
+            self._expressions[slot] = locator_info.locator_expression
     
     def get_locator(self, normalized_name: str) -> Optional[LocatorInfo]:
         """Get locator by normalized name."""
         return self.locators.get(normalized_name)
     
     def find_partial_match(self, token: str) -> Optional[str]:
-        """Find partial match for a token."""
+        """Find partial match for a token.
+        
+        Returns the earliest added name that contains the token or is
+        contained in it (case-insensitive). Both directions walk a trie with
+        the token's characters, so the cost depends on the token length
+        rather than on the number of locators. Results are memoized until
+        a new name is added.
+        """
+        try:
+            return self._partial_cache[token]
+        except KeyError:
+            match = self._partial_cache[token] = self._walk_partial_match(token)
+            return match
+    
+    def find_fuzzy_match(self, token: str, max_distance: int) -> Optional[str]:
+        """Find the name closest to a token by edit distance.
+        
+        Comparison is case-insensitive. Names whose length alone puts them
+        further away than the best distance so far are skipped without
+        computing a distance; ties go to the earliest added name. Results
+        are memoized until a new name is added.
+        
+        Args:
+            token: Token to match
+            max_distance: Largest edit distance accepted
+            
+        Returns:
+            Closest name within max_distance, or None
+        """
+        key = (token, max_distance)
+        try:
+            return self._fuzzy_cache[key]
+        except KeyError:
+            pass
+        
         token_lower = token.lower()
-        for name, locator_info in self.locators.items():
-            if token_lower in name.lower() or name.lower() in token_lower:
-                return name
-        return None
+        best = None
+        best_distance = max_distance + 1
+        for name in self._names:
+            if abs(len(name) - len(token_lower)) >= best_distance:
+                continue
+            distance = levenshtein(token_lower, name.lower(), best_distance - 1)
+            if distance < best_distance:
+                best, best_distance = name, distance
+        
+        self._fuzzy_cache[key] = best
+        return best
+    
+    def _walk_partial_match(self, token: str) -> Optional[str]:
+        """Uncached trie walk behind find_partial_match."""
+        if self._trie_size < len(self._names):
+            self._index_tries()
+        
+        token_lower = token.lower()
+        
+        # Token inside a name: the token is a path from the suffix trie root
+        best: Optional[int] = None
+        trie_node = self._suffix_trie
+        for char in token_lower:
+            child = trie_node.get(char)
+            if child is None:
+                break
+            trie_node = child
+        else:
+            best = trie_node.get(None)
+        
+        # Name inside the token: one pass through the name automaton
+        goto, fail, out = self._name_goto, self._name_fail, self._name_out
+        slot = out[0]
+        if slot is not None and (best is None or slot < best):
+            best = slot
+        node = 0
+        for char in token_lower:
+            if best == 0:
+                break
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            slot = out[node]
+            if slot is not None and (best is None or slot < best):
+                best = slot
+        
+        return self._names[best] if best is not None else None
 
 
 class BDDStep(BaseModel):
     """A BDD step."""
+    model_config = ConfigDict(frozen=True)
+    
     step_type: StepType
     text: str = Field(..., description="Step text")
     tokens: List[str] = Field(default_factory=list, description="Extracted tokens from step")
@@ -60,6 +278,8 @@ class BDDStep(BaseModel):
 
 class BDDScenario(BaseModel):
     """A BDD scenario."""
+    model_config = _DEFERRED_FROZEN
+    
     name: str
     steps: List[BDDStep] = Field(default_factory=list)
     tags: List[str] = Field(default_factory=list)
@@ -67,6 +287,8 @@ class BDDScenario(BaseModel):
 
 class BDDFeature(BaseModel):
     """A BDD feature file."""
+    model_config = _DEFERRED
+    
     feature_name: str
     description: str = ""
     scenarios: List[BDDScenario] = Field(default_factory=list)
@@ -75,15 +297,19 @@ class BDDFeature(BaseModel):
 
 class MappingResult(BaseModel):
     """Result of mapping a step to a locator."""
+    model_config = _DEFERRED_FROZEN
+    
     step: BDDStep
     matched: bool
     locator_variable: Optional[str] = None
-    match_type: Optional[str] = None  # "exact", "partial", "none"
+    match_type: Optional[str] = None  # "exact", "partial", "fuzzy", "none"
     warning: Optional[str] = None
 
 
 class FusionReport(BaseModel):
     """Fusion mapping report."""
+    model_config = _DEFERRED
+    
     feature_name: str
     total_steps: int
     matched_steps: int
@@ -100,4 +326,6 @@ class FusionConfig(BaseModel):
     enable_partial_matching: bool = True
     strict_mode: bool = False
     output_format: str = "both"  # "feature", "steps", "both"
+    max_workers: int = 1  # Threads used to map scenarios; 1 maps sequentially
+    fuzzy_max_distance: int = 0  # Edit distance tolerated for typo matches; 0 disables
 
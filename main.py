@@ -1,31 +1,45 @@
 """Main pipeline script for SmartFusionAI."""
 
 import argparse
+import logging
+import multiprocessing
 import sys
 import shutil
-import tempfile
-import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
-# External library imports (required dependencies)
-try:
-    from phoenix_smartlocatorai import dom_scanner, page_object_exporter  # type: ignore
-except ImportError:
-    dom_scanner = None
-    page_object_exporter = None
-
-try:
-    from phoenix_smartcaseai import StoryBDDGenerator  # type: ignore
-except ImportError:
-    StoryBDDGenerator = None
-
-from core.locator_engine import LocatorParser
+from core.locator_engine import LocatorParser, ParseCache
 from core.case_engine import BDDGenerator
 from core.fusion_mapper import FusionMapper
 from core.step_definitions import StepDefinitionGenerator
-from core.exporters import OutputExporter
-from core.utils.models import FusionConfig, LocatorType
+from core.exporters import OutputExporter, write_json
+from core.utils.models import (
+    BDDFeature,
+    FusionConfig,
+    FusionReport,
+    LocatorDictionary,
+    LocatorType,
+)
+
+
+logger = logging.getLogger("smartfusion")
+
+
+def _configure_logging(quiet: bool = False) -> None:
+    """Send pipeline progress to stdout, or only warnings under --quiet.
+    
+    Also used as the process pool initializer, so batch workers log at the
+    same level as the parent.
+    
+    Args:
+        quiet: Suppress informational progress messages
+    """
+    logging.basicConfig(
+        level=logging.WARNING if quiet else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout
+    )
 
 
 class SmartFusionPipeline:
@@ -35,7 +49,8 @@ class SmartFusionPipeline:
         self,
         output_dir: str = "output",
         framework: LocatorType = LocatorType.PLAYWRIGHT,
-        strict_mode: bool = False
+        strict_mode: bool = False,
+        use_cache: bool = False
     ):
         """Initialize the pipeline.
         
@@ -43,6 +58,7 @@ class SmartFusionPipeline:
             output_dir: Output directory
             framework: Framework type (Playwright or Selenium)
             strict_mode: Enable strict mode (fail on unmatched locators)
+            use_cache: Reuse parsed locator files from the on-disk parse cache
         """
         self.config = FusionConfig(
             framework=framework,
@@ -50,18 +66,41 @@ class SmartFusionPipeline:
             output_format="both"
         )
         
-        self.locator_parser = LocatorParser(locator_type=framework)
+        # Config fields are fixed for the pipeline's lifetime, so resolve
+        # these once rather than on every run
+        self._llm_provider = getattr(self.config, 'llm_provider', 'openai')
+        self._framework_str = framework.value
+        
+        self.locator_parser = LocatorParser(
+            locator_type=framework,
+            cache=ParseCache() if use_cache else None
+        )
         self.bdd_generator = BDDGenerator()
         self.fusion_mapper = FusionMapper(config=self.config)
         self.step_generator = StepDefinitionGenerator(framework=framework)
         self.exporter = OutputExporter(output_dir=output_dir)
+        
+        # Output files are independent, so they are written on background
+        # threads (started lazily on first submit)
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
+    
+    def close(self):
+        """Wait for pending output writes and stop the writer threads."""
+        self._io_pool.shutdown()
+    
+    def __enter__(self) -> "SmartFusionPipeline":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
     
     def run(
         self,
         user_story_path: Optional[str] = None,
         bdd_feature_path: Optional[str] = None,
         locator_file_path: Optional[str] = None,
-        dom_snapshot_path: Optional[str] = None
+        dom_snapshot_path: Optional[str] = None,
+        locator_dict: Optional[LocatorDictionary] = None
     ):
         """Run the complete fusion pipeline.
         
@@ -70,99 +109,94 @@ class SmartFusionPipeline:
             bdd_feature_path: Path to existing BDD feature file
             locator_file_path: Path to locator file (page.py or locators.json)
             dom_snapshot_path: Path to DOM snapshot (optional, for future use)
+            locator_dict: Already parsed locators; skips parsing locator_file_path
         
         Returns:
             Dictionary with output paths
         """
-        print("Starting SmartFusionAI Pipeline...")
-        print("=" * 60)
+        logger.info("Starting SmartFusionAI Pipeline...")
+        logger.info("=" * 60)
         
         # Step 1: Parse locators
-        print("\nStep 1: Parsing locators...")
-        if not locator_file_path:
-            raise ValueError("locator_file_path is required")
-        
-        locator_dict = self.locator_parser.parse(locator_file_path)
-        print(f"   [OK] Found {len(locator_dict.locators)} locators")
-        for name, info in locator_dict.locators.items():
-            print(f"     - {name} -> {info.variable_name}")
+        logger.info("\nStep 1: Parsing locators...")
+        if locator_dict is None:
+            if not locator_file_path:
+                raise ValueError("locator_file_path is required")
+            locator_dict = self.locator_parser.parse(locator_file_path)
+        logger.info(f"   [OK] Found {len(locator_dict.locators)} locators")
+        # The per-locator listing is only built when it will be shown, and
+        # then emitted as one record rather than one write per locator
+        if locator_dict.locators and logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join(
+                f"     - {name} -> {info.variable_name}"
+                for name, info in locator_dict.locators.items()
+            ))
         
         # Step 2: Generate or parse BDD feature
-        print("\nStep 2: Processing BDD feature...")
+        logger.info("\nStep 2: Processing BDD feature...")
         if bdd_feature_path:
             feature = self.bdd_generator.parse_feature_file(bdd_feature_path)
-            print(f"   [OK] Parsed feature: {feature.feature_name}")
+            logger.info(f"   [OK] Parsed feature: {feature.feature_name}")
         elif user_story_path:
             with open(user_story_path, 'r', encoding='utf-8') as f:
                 user_story = f.read()
             # Use SmartCaseAI directly through BDDGenerator
             feature = self.bdd_generator.generate_from_story(
                 user_story, 
-                llm_provider=getattr(self.config, 'llm_provider', 'openai')
+                llm_provider=self._llm_provider
             )
-            print(f"   [OK] Generated feature from user story using SmartCaseAI")
+            logger.info(f"   [OK] Generated feature from user story using SmartCaseAI")
         else:
             raise ValueError("Either bdd_feature_path or user_story_path is required")
         
-        print(f"   [OK] Found {len(feature.scenarios)} scenarios")
+        logger.info(f"   [OK] Found {len(feature.scenarios)} scenarios")
         total_steps = sum(len(s.steps) for s in feature.scenarios)
-        print(f"   [OK] Total steps: {total_steps}")
+        logger.info(f"   [OK] Total steps: {total_steps}")
         
         # Step 3: Map BDD steps to locators
-        print("\nStep 3: Mapping BDD steps to locators...")
-        enhanced_feature, fusion_report = self.fusion_mapper.map_feature(
+        logger.info("\nStep 3: Mapping BDD steps to locators...")
+        # The traceability table is built in the same pass over the steps
+        enhanced_feature, fusion_report, mapping_table = self.fusion_mapper.map_feature_with_table(
             feature,
             locator_dict
         )
         
-        print(f"   [OK] Matched {fusion_report.matched_steps}/{fusion_report.total_steps} steps")
+        logger.info(f"   [OK] Matched {fusion_report.matched_steps}/{fusion_report.total_steps} steps")
         if fusion_report.unmatched_steps > 0:
-            print(f"   [WARN] Unmatched steps: {fusion_report.unmatched_steps}")
+            logger.warning(f"   [WARN] Unmatched steps: {fusion_report.unmatched_steps}")
             if fusion_report.unmatched_tokens:
-                print(f"   [WARN] Unmatched tokens: {', '.join(fusion_report.unmatched_tokens)}")
+                logger.warning(f"   [WARN] Unmatched tokens: {', '.join(fusion_report.unmatched_tokens)}")
         
         # Step 4: Generate step definitions
-        print("\nStep 4: Generating step definitions...")
+        logger.info("\nStep 4: Generating step definitions...")
         step_definitions = self.step_generator.generate(enhanced_feature)
-        print(f"   [OK] Generated {self.config.framework.value} step definitions")
+        logger.info(f"   [OK] Generated {self.config.framework.value} step definitions")
         
         # Step 5: Generate mapping table
-        print("\nStep 5: Generating traceability mapping...")
-        mapping_table = self.fusion_mapper.generate_mapping_table(
-            enhanced_feature,
-            locator_dict
-        )
-        print(f"   [OK] Generated mapping table")
+        logger.info("\nStep 5: Generating traceability mapping...")
+        logger.info(f"   [OK] Generated mapping table")
         
         # Step 6: Export outputs
-        print("\nStep 6: Exporting outputs...")
-        
-        feature_path = self.exporter.export_feature(enhanced_feature)
-        print(f"   [OK] Exported feature: {feature_path}")
+        logger.info("\nStep 6: Exporting outputs...")
         
-        steps_path = self.exporter.export_step_definitions(
+        feature_path, steps_path, report_path, mapping_path = self._export_outputs(
+            enhanced_feature,
             step_definitions,
-            enhanced_feature.feature_name,
-            self.config.framework
+            fusion_report,
+            mapping_table
         )
-        print(f"   [OK] Exported step definitions: {steps_path}")
-        
-        report_path = self.exporter.export_fusion_report(fusion_report)
-        print(f"   [OK] Exported fusion report: {report_path}")
-        
-        mapping_path = self.exporter.export_mapping_table(
-            mapping_table,
-            enhanced_feature.feature_name
-        )
-        print(f"   [OK] Exported mapping table: {mapping_path}")
-        
-        print("\n" + "=" * 60)
-        print("Pipeline completed successfully!")
-        print("\nOutput files:")
-        print(f"   - Enhanced Feature: {feature_path}")
-        print(f"   - Step Definitions: {steps_path}")
-        print(f"   - Fusion Report: {report_path}")
-        print(f"   - Mapping Table: {mapping_path}")
+        logger.info(f"   [OK] Exported feature: {feature_path}")
+        logger.info(f"   [OK] Exported step definitions: {steps_path}")
+        logger.info(f"   [OK] Exported fusion report: {report_path}")
+        logger.info(f"   [OK] Exported mapping table: {mapping_path}")
+        
+        logger.info("\n" + "=" * 60)
+        logger.info("Pipeline completed successfully!")
+        logger.info("\nOutput files:")
+        logger.info(f"   - Enhanced Feature: {feature_path}")
+        logger.info(f"   - Step Definitions: {steps_path}")
+        logger.info(f"   - Fusion Report: {report_path}")
+        logger.info(f"   - Mapping Table: {mapping_path}")
         
         return {
             "feature": str(feature_path),
@@ -171,6 +205,43 @@ class SmartFusionPipeline:
             "mapping_table": str(mapping_path)
         }
     
+    def _export_outputs(
+        self,
+        enhanced_feature: BDDFeature,
+        step_definitions: str,
+        fusion_report: FusionReport,
+        mapping_table: Dict[str, Any]
+    ) -> Tuple[Path, Path, Path, Path]:
+        """Write the four pipeline outputs concurrently.
+        
+        Args:
+            enhanced_feature: Mapped BDD feature
+            step_definitions: Step definition code
+            fusion_report: Fusion report
+            mapping_table: Traceability mapping table
+            
+        Returns:
+            Tuple of (feature_path, steps_path, report_path, mapping_path)
+        """
+        futures = [
+            self._io_pool.submit(self.exporter.export_feature, enhanced_feature),
+            self._io_pool.submit(
+                self.exporter.export_step_definitions,
+                step_definitions,
+                enhanced_feature.feature_name,
+                self.config.framework
+            ),
+            self._io_pool.submit(self.exporter.export_fusion_report, fusion_report),
+            self._io_pool.submit(
+                self.exporter.export_mapping_table,
+                mapping_table,
+                enhanced_feature.feature_name
+            )
+        ]
+        
+        # result() re-raises any write error in the caller
+        return tuple(future.result() for future in futures)
+    
     def run_auto_mode(
         self,
         url: str,
@@ -193,61 +264,63 @@ class SmartFusionPipeline:
         Returns:
             Dictionary with all output paths including generated locators
         """
-        print("Starting SmartFusionAI Auto Mode...")
-        print("=" * 60)
-        print("This mode will automatically generate:")
-        print("  1. Locators (locators.json + page.py) from URL")
-        print("  2. BDD Feature file from user story")
-        print("  3. Enhanced feature with locator mapping")
-        print("  4. PyTest automation test code")
-        print("=" * 60)
+        logger.info("Starting SmartFusionAI Auto Mode...")
+        logger.info("=" * 60)
+        logger.info("This mode will automatically generate:")
+        logger.info("  1. Locators (locators.json + page.py) from URL")
+        logger.info("  2. BDD Feature file from user story")
+        logger.info("  3. Enhanced feature with locator mapping")
+        logger.info("  4. PyTest automation test code")
+        logger.info("=" * 60)
         
         # Step 1: Generate locators from URL using SmartLocatorAI
-        print("\n[Step 1/6] Generating locators from URL...")
+        logger.info("\n[Step 1/6] Generating locators from URL...")
         locator_file_path = None
         page_py_path = None
         
-        # Use SmartLocatorAI modular components: dom_scanner and page_object_exporter
-        if dom_scanner is None or page_object_exporter is None:
+        # Use SmartLocatorAI modular components: dom_scanner and page_object_exporter.
+        # Imported here rather than at module level since they pull in heavy
+        # dependencies that only auto mode needs
+        try:
+            from phoenix_smartlocatorai import dom_scanner, page_object_exporter  # type: ignore
+        except ImportError as e:
             raise ImportError(
                 "phoenix-smartlocatorai package not found. Please install it: "
                 "pip install phoenix-smartlocatorai"
-            )
+            ) from e
         
         # Step 1: Scan DOM to get locators
         input_source = dom_snapshot_path if (dom_snapshot_path and Path(dom_snapshot_path).exists()) else url
         if dom_snapshot_path and Path(dom_snapshot_path).exists():
-            print(f"   [INFO] Using DOM snapshot: {dom_snapshot_path}")
-            # Read HTML file
-            with open(dom_snapshot_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            logger.info(f"   [INFO] Using DOM snapshot: {dom_snapshot_path}")
+            # Read raw bytes and decode once, skipping the text-mode
+            # reader's buffered decode of a possibly multi-MB page
+            html_content = Path(dom_snapshot_path).read_bytes().decode('utf-8', errors='ignore')
             locators = dom_scanner.scan_dom(html_content, js_render=False)
         else:
-            print(f"   [INFO] Fetching DOM from URL: {url}")
+            logger.info(f"   [INFO] Fetching DOM from URL: {url}")
             # Scan from URL (dom_scanner handles URL fetching)
             locators = dom_scanner.scan_dom(url, js_render=False)
         
         if not locators:
             raise ValueError("No locators generated from the provided URL/HTML")
         
-        print(f"   [OK] Scanned {len(locators)} elements from DOM")
+        logger.info(f"   [OK] Scanned {len(locators)} elements from DOM")
         
         # Step 2: Save locators to JSON
         target_locators_dir = Path(self.exporter.output_dir) / "generated_locators"
         target_locators_dir.mkdir(parents=True, exist_ok=True)
         
         locators_json_path = target_locators_dir / "locators.json"
-        with open(locators_json_path, 'w', encoding='utf-8') as f:
-            json.dump({"locators": locators}, f, indent=2, ensure_ascii=False)
+        write_json({"locators": locators}, locators_json_path)
         
         locator_file_path = str(locators_json_path)
-        print(f"   [OK] Generated locators.json: {locator_file_path}")
+        logger.info(f"   [OK] Generated locators.json: {locator_file_path}")
         
         # Step 3: Generate Page Object Model
-        framework_str = "playwright" if self.config.framework == LocatorType.PLAYWRIGHT else "selenium"
         class_name = "GeneratedPage"
         
-        if framework_str == "playwright":
+        if self._framework_str == "playwright":
             page_object_code = page_object_exporter.generate_playwright_pom(
                 locators=locators,
                 class_name=class_name
@@ -258,41 +331,46 @@ class SmartFusionPipeline:
                 class_name=class_name
             )
         
-        # Save Page Object to file
+        # Save Page Object to file. Nothing later in the run reads it back,
+        # so it is encoded once and written as raw bytes in the background
         page_py_path = target_locators_dir / "page.py"
-        with open(page_py_path, 'w', encoding='utf-8') as f:
-            f.write(page_object_code)
+        page_write = self._io_pool.submit(
+            page_py_path.write_bytes,
+            page_object_code.encode('utf-8')
+        )
         
         page_py_path = str(page_py_path)
-        print(f"   [OK] Generated page.py: {page_py_path}")
+        logger.info(f"   [OK] Generated page.py: {page_py_path}")
         
         # Step 2: Process user story and context files
-        print("\n[Step 2/6] Processing user story and context files...")
+        logger.info("\n[Step 2/6] Processing user story and context files...")
         user_story_text = user_story
         
         if user_story_file:
             if Path(user_story_file).exists():
                 with open(user_story_file, 'r', encoding='utf-8') as f:
                     user_story_text = f.read()
-                print(f"   [OK] Loaded user story from: {user_story_file}")
+                logger.info(f"   [OK] Loaded user story from: {user_story_file}")
             else:
-                print(f"   [WARN] User story file not found: {user_story_file}")
+                logger.warning(f"   [WARN] User story file not found: {user_story_file}")
         
         if not user_story_text:
             raise ValueError("User story is required (provide --user-story-text or --user-story-file)")
         
         # Step 3: Generate BDD feature from user story using SmartCaseAI
-        print("\n[Step 3/6] Generating BDD feature from user story...")
-        if StoryBDDGenerator is None:
+        logger.info("\n[Step 3/6] Generating BDD feature from user story...")
+        try:
+            from phoenix_smartcaseai import StoryBDDGenerator  # type: ignore
+        except ImportError as e:
             raise ImportError(
                 "phoenix-smartcaseai package not found. Please install it: "
                 "pip install phoenix-smartcaseai"
-            )
+            ) from e
         
         bdd_generator = StoryBDDGenerator(llm_provider=llm_provider)
         
         if context_files:
-            print(f"   [INFO] Passing {len(context_files)} context file(s) to SmartCaseAI...")
+            logger.info(f"   [INFO] Passing {len(context_files)} context file(s) to SmartCaseAI...")
         
         # SmartCaseAI handles everything - file processing, LLM calls, BDD generation
         feature_content = bdd_generator.generate_test_cases(
@@ -304,57 +382,58 @@ class SmartFusionPipeline:
         # Save generated feature file
         feature_file_path = Path(self.exporter.output_dir) / "generated_bdd" / "generated_feature.feature"
         feature_file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(feature_file_path, 'w', encoding='utf-8') as f:
-            f.write(feature_content)
-        print(f"   [OK] Generated BDD feature: {feature_file_path}")
+        # Write in the background and parse the in-memory copy meanwhile;
+        # the write is awaited before reporting success
+        feature_write = self._io_pool.submit(
+            feature_file_path.write_text,
+            feature_content,
+            encoding='utf-8'
+        )
+        logger.info(f"   [OK] Generated BDD feature: {feature_file_path}")
         
         # Parse the generated feature
         feature = self.bdd_generator.parse_feature_content(feature_content)
         
-        print(f"   [OK] Generated {len(feature.scenarios)} scenarios")
+        logger.info(f"   [OK] Generated {len(feature.scenarios)} scenarios")
         
         # Step 4: Parse generated locators
-        print("\n[Step 4/6] Parsing generated locators...")
+        logger.info("\n[Step 4/6] Parsing generated locators...")
         locator_dict = self.locator_parser.parse(locator_file_path)
-        print(f"   [OK] Found {len(locator_dict.locators)} locators")
+        logger.info(f"   [OK] Found {len(locator_dict.locators)} locators")
         
         # Step 5: Map BDD steps to locators
-        print("\n[Step 5/6] Mapping BDD steps to locators...")
-        enhanced_feature, fusion_report = self.fusion_mapper.map_feature(
+        logger.info("\n[Step 5/6] Mapping BDD steps to locators...")
+        enhanced_feature, fusion_report, mapping_table = self.fusion_mapper.map_feature_with_table(
             feature,
             locator_dict
         )
-        print(f"   [OK] Matched {fusion_report.matched_steps}/{fusion_report.total_steps} steps")
+        logger.info(f"   [OK] Matched {fusion_report.matched_steps}/{fusion_report.total_steps} steps")
         
         # Step 6: Generate step definitions and export
-        print("\n[Step 6/6] Generating step definitions and exporting...")
+        logger.info("\n[Step 6/6] Generating step definitions and exporting...")
         step_definitions = self.step_generator.generate(enhanced_feature)
-        mapping_table = self.fusion_mapper.generate_mapping_table(enhanced_feature, locator_dict)
         
         # Export all outputs
-        feature_path = self.exporter.export_feature(enhanced_feature)
-        steps_path = self.exporter.export_step_definitions(
+        feature_path, steps_path, report_path, mapping_path = self._export_outputs(
+            enhanced_feature,
             step_definitions,
-            enhanced_feature.feature_name,
-            self.config.framework
-        )
-        report_path = self.exporter.export_fusion_report(fusion_report)
-        mapping_path = self.exporter.export_mapping_table(
-            mapping_table,
-            enhanced_feature.feature_name
+            fusion_report,
+            mapping_table
         )
+        page_write.result()
+        feature_write.result()
         
-        print("\n" + "=" * 60)
-        print("Auto Mode completed successfully!")
-        print("\nGenerated Files:")
-        print(f"   - Locators JSON: {locator_file_path}")
+        logger.info("\n" + "=" * 60)
+        logger.info("Auto Mode completed successfully!")
+        logger.info("\nGenerated Files:")
+        logger.info(f"   - Locators JSON: {locator_file_path}")
         if page_py_path:
-            print(f"   - Page Object: {page_py_path}")
-        print(f"   - BDD Feature: {feature_path}")
-        print(f"   - Step Definitions: {steps_path}")
-        print(f"   - Fusion Report: {report_path}")
-        print(f"   - Mapping Table: {mapping_path}")
-        print("=" * 60)
+            logger.info(f"   - Page Object: {page_py_path}")
+        logger.info(f"   - BDD Feature: {feature_path}")
+        logger.info(f"   - Step Definitions: {steps_path}")
+        logger.info(f"   - Fusion Report: {report_path}")
+        logger.info(f"   - Mapping Table: {mapping_path}")
+        logger.info("=" * 60)
         
         return {
             "locators_json": str(locator_file_path),
@@ -366,8 +445,63 @@ class SmartFusionPipeline:
         }
 
 
-def main():
-    """Main entry point."""
+def _log_file_header(label: str, path: str):
+    """Log the header that introduces one batch file's output."""
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Processing {label}: {path}")
+    logger.info('='*60)
+
+
+def _run_one(
+    pipeline_kwargs: Dict[str, Any],
+    locator_dict_json: str,
+    label: str,
+    run_kwargs: Dict[str, Any],
+    dom_snapshot_path: Optional[str] = None
+) -> Dict[str, str]:
+    """Run the pipeline for one batch file (process pool worker).
+    
+    Args:
+        pipeline_kwargs: SmartFusionPipeline constructor arguments
+        locator_dict_json: Parsed locators, serialized with model_dump_json()
+        label: Batch position of the file, e.g. "BDD Feature 2/3"
+        run_kwargs: The file to process (user_story_path or bdd_feature_path)
+        dom_snapshot_path: Path to DOM snapshot (optional)
+        
+    Returns:
+        Dictionary with output paths
+    """
+    # Workers log concurrently, so each file's output starts with its header
+    _log_file_header(label, next(iter(run_kwargs.values())))
+    with SmartFusionPipeline(**pipeline_kwargs) as pipeline:
+        return pipeline.run(
+            **run_kwargs,
+            dom_snapshot_path=dom_snapshot_path,
+            locator_dict=LocatorDictionary.model_validate_json(locator_dict_json)
+        )
+
+
+# Batch workers are forked on Linux so they inherit this process's
+# already-imported modules (precompiled regexes, step templates, warm name
+# caches) instead of re-importing and recompiling them under spawn or
+# forkserver. Elsewhere the platform default is kept, as fork is unsafe on
+# macOS and unavailable on Windows.
+_POOL_CONTEXT = multiprocessing.get_context("fork") if sys.platform.startswith("linux") else None
+
+
+# --framework choice -> LocatorType
+_FRAMEWORK_MAP = {
+    "playwright": LocatorType.PLAYWRIGHT,
+    "selenium": LocatorType.SELENIUM
+}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser.
+    
+    Returns:
+        Configured ArgumentParser
+    """
     parser = argparse.ArgumentParser(
         description="SmartFusionAI - Unified Engine for BDD + Locators"
     )
@@ -439,7 +573,7 @@ def main():
     parser.add_argument(
         "--framework",
         type=str,
-        choices=["playwright", "selenium"],
+        choices=list(_FRAMEWORK_MAP),
         default="playwright",
         help="Test framework (default: playwright)"
     )
@@ -450,6 +584,26 @@ def main():
         help="Enable strict mode (fail on unmatched locators)"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for batch mode (default: 1, sequential)"
+    )
+    
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Reuse parsed locator files from ~/.smartfusion/parse_cache.db (default: disabled)"
+    )
+    
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Only print warnings and errors"
+    )
+    
     parser.add_argument(
         "--generate-locators",
         action="store_true",
@@ -484,7 +638,18 @@ def main():
         help="LLM provider for SmartCaseAI (default: openai)"
     )
     
+    return parser
+
+
+# Built once at import; main() only parses
+_PARSER = _build_parser()
+
+
+def main():
+    """Main entry point."""
+    parser = _PARSER
     args = parser.parse_args()
+    _configure_logging(args.quiet)
     
     # Handle auto mode first
     if args.auto:
@@ -493,26 +658,25 @@ def main():
         if not args.user_story_text and not args.user_story:
             parser.error("User story is required for auto mode (use --user-story-text or --user-story)")
         
-        framework = LocatorType.PLAYWRIGHT if args.framework == "playwright" else LocatorType.SELENIUM
+        framework = _FRAMEWORK_MAP[args.framework]
         
-        pipeline = SmartFusionPipeline(
+        with SmartFusionPipeline(
             output_dir=args.output_dir,
             framework=framework,
             strict_mode=args.strict
-        )
-        
-        try:
-            pipeline.run_auto_mode(
-                url=args.url,
-                user_story=args.user_story_text,
-                user_story_file=args.user_story,
-                dom_snapshot_path=args.dom_snapshot,
-                context_files=args.context_files,
-                llm_provider=args.llm_provider
-            )
-        except Exception as e:
-            print(f"\n[ERROR] {e}", file=sys.stderr)
-            sys.exit(1)
+        ) as pipeline:
+            try:
+                pipeline.run_auto_mode(
+                    url=args.url,
+                    user_story=args.user_story_text,
+                    user_story_file=args.user_story,
+                    dom_snapshot_path=args.dom_snapshot,
+                    context_files=args.context_files,
+                    llm_provider=args.llm_provider
+                )
+            except Exception as e:
+                print(f"\n[ERROR] {e}", file=sys.stderr)
+                sys.exit(1)
         
         return
     
@@ -535,13 +699,15 @@ def main():
     # Handle URL-based locator generation
     locator_file_path = args.locator_file
     if args.generate_locators and args.url:
-        print("Generating locators from URL using SmartLocatorAI...")
+        logger.info("Generating locators from URL using SmartLocatorAI...")
         # Use SmartLocatorAI modular components
-        if dom_scanner is None or page_object_exporter is None:
+        try:
+            from phoenix_smartlocatorai import dom_scanner  # type: ignore
+        except ImportError as e:
             raise ImportError(
                 "phoenix-smartlocatorai package not found. Please install it: "
                 "pip install phoenix-smartlocatorai"
-            )
+            ) from e
         
         # Scan DOM from URL
         locators = dom_scanner.scan_dom(args.url, js_render=False)
@@ -549,87 +715,122 @@ def main():
         if not locators:
             raise ValueError("No locators generated from the provided URL")
         
-        print(f"   [OK] Scanned {len(locators)} elements from DOM")
+        logger.info(f"   [OK] Scanned {len(locators)} elements from DOM")
         
         # Save to temporary JSON file
         import tempfile
-        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8')
-        json.dump({"locators": locators}, temp_file, indent=2, ensure_ascii=False)
+        temp_file = tempfile.NamedTemporaryFile(suffix='.json', delete=False)
         temp_file.close()
+        write_json({"locators": locators}, Path(temp_file.name))
         locator_file_path = temp_file.name
-        print(f"   [OK] Generated locators saved to: {locator_file_path}")
+        logger.info(f"   [OK] Generated locators saved to: {locator_file_path}")
     
     # For normal mode, locator file is required unless generating from URL
     if not args.generate_locators and (not locator_file_path or not Path(locator_file_path).exists()):
         parser.error(f"Locator file not found: {locator_file_path}")
     
     # Run pipeline
-    framework = LocatorType.PLAYWRIGHT if args.framework == "playwright" else LocatorType.SELENIUM
+    framework = _FRAMEWORK_MAP[args.framework]
     
-    pipeline = SmartFusionPipeline(
-        output_dir=args.output_dir,
-        framework=framework,
-        strict_mode=args.strict
-    )
+    pipeline_kwargs = {
+        "output_dir": args.output_dir,
+        "framework": framework,
+        "strict_mode": args.strict
+    }
+    pipeline = SmartFusionPipeline(**pipeline_kwargs, use_cache=args.cache)
     
-    # Batch processing mode
-    if args.batch or len(user_stories) > 1 or len(bdd_features) > 1:
-        print(f"\nBatch Processing Mode: Processing {len(user_stories) + len(bdd_features)} files...")
-        results = []
-        
-        # Process user stories
-        for i, story_path in enumerate(user_stories, 1):
-            if not story_path:
-                continue
-            print(f"\n{'='*60}")
-            print(f"Processing User Story {i}/{len(user_stories)}: {story_path}")
-            print('='*60)
+    # Waits for background output writes before exiting
+    with pipeline:
+        # Batch processing mode
+        if args.batch or len(user_stories) > 1 or len(bdd_features) > 1:
+            logger.info(f"\nBatch Processing Mode: Processing {len(user_stories) + len(bdd_features)} files...")
+            results = []
+            
+            # (label, path, pipeline.run keyword for the path) per file
+            tasks = [
+                (f"User Story {i}/{len(user_stories)}", story_path, "user_story_path")
+                for i, story_path in enumerate(user_stories, 1) if story_path
+            ] + [
+                (f"BDD Feature {i}/{len(bdd_features)}", feature_path, "bdd_feature_path")
+                for i, feature_path in enumerate(bdd_features, 1) if feature_path
+            ]
+            
+            # Every file in the batch shares the same locator file, so parse it once
             try:
-                result = pipeline.run(
-                    user_story_path=story_path,
-                    locator_file_path=locator_file_path,
-                    dom_snapshot_path=args.dom_snapshot
-                )
-                results.append(result)
+                locator_dict = pipeline.locator_parser.parse(locator_file_path)
             except Exception as e:
-                print(f"\n[ERROR] Failed to process {story_path}: {e}", file=sys.stderr)
+                print(f"\n[ERROR] Failed to parse {locator_file_path}: {e}", file=sys.stderr)
                 if args.strict:
                     sys.exit(1)
-        
-        # Process BDD features
-        for i, feature_path in enumerate(bdd_features, 1):
-            if not feature_path:
-                continue
-            print(f"\n{'='*60}")
-            print(f"Processing BDD Feature {i}/{len(bdd_features)}: {feature_path}")
-            print('='*60)
+                # Every file needs the locators, so each one fails on its own
+                # and the batch still completes
+                for _, path, _ in tasks:
+                    print(f"\n[ERROR] Failed to process {path}: {e}", file=sys.stderr)
+                tasks = []
+            
+            if args.workers > 1 and len(tasks) > 1:
+                # Files are independent and CPU-bound, so each worker process
+                # rebuilds a pipeline and maps one file; the parsed locators are
+                # shipped to the workers once as JSON
+                locator_dict_json = locator_dict.model_dump_json()
+                with ProcessPoolExecutor(
+                    max_workers=min(args.workers, len(tasks)),
+                    mp_context=_POOL_CONTEXT,
+                    initializer=_configure_logging,
+                    initargs=(args.quiet,)
+                ) as executor:
+                    futures = [
+                        (path, executor.submit(
+                            _run_one,
+                            pipeline_kwargs,
+                            locator_dict_json,
+                            label,
+                            {path_arg: path},
+                            args.dom_snapshot
+                        ))
+                        for label, path, path_arg in tasks
+                    ]
+                    
+                    # Collect in submission order so results stay deterministic
+                    for path, future in futures:
+                        try:
+                            results.append(future.result())
+                        except Exception as e:
+                            print(f"\n[ERROR] Failed to process {path}: {e}", file=sys.stderr)
+                            if args.strict:
+                                executor.shutdown(cancel_futures=True)
+                                sys.exit(1)
+            else:
+                for label, path, path_arg in tasks:
+                    _log_file_header(label, path)
+                    try:
+                        result = pipeline.run(
+                            **{path_arg: path},
+                            locator_file_path=locator_file_path,
+                            dom_snapshot_path=args.dom_snapshot,
+                            locator_dict=locator_dict
+                        )
+                        results.append(result)
+                    except Exception as e:
+                        print(f"\n[ERROR] Failed to process {path}: {e}", file=sys.stderr)
+                        if args.strict:
+                            sys.exit(1)
+            
+            logger.info(f"\n{'='*60}")
+            logger.info(f"Batch Processing Complete: {len(results)} files processed successfully")
+            logger.info('='*60)
+        else:
+            # Single file processing
             try:
-                result = pipeline.run(
-                    bdd_feature_path=feature_path,
+                pipeline.run(
+                    user_story_path=args.user_story,
+                    bdd_feature_path=args.bdd_feature,
                     locator_file_path=locator_file_path,
                     dom_snapshot_path=args.dom_snapshot
                 )
-                results.append(result)
             except Exception as e:
-                print(f"\n[ERROR] Failed to process {feature_path}: {e}", file=sys.stderr)
-                if args.strict:
-                    sys.exit(1)
-        
-        print(f"\n{'='*60}")
-        print(f"Batch Processing Complete: {len(results)} files processed successfully")
-        print('='*60)
-    else:
-        # Single file processing
-        try:
-            pipeline.run(
-                user_story_path=args.user_story,
-                bdd_feature_path=args.bdd_feature,
-                locator_file_path=locator_file_path,
-                dom_snapshot_path=args.dom_snapshot
-            )
-        except Exception as e:
-            print(f"\n[ERROR] {e}", file=sys.stderr)
-            sys.exit(1)
+                print(f"\n[ERROR] {e}", file=sys.stderr)
+                sys.exit(1)
 
 
 if __name__ == "__main__":
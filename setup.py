@@ -1,5 +1,6 @@
 """Setup script for Phoenix-SmartFusionAI."""
 
+import os
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -7,6 +8,17 @@ from pathlib import Path
 readme_file = Path(__file__).parent / "README.md"
 long_description = readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
 
+# Opt-in ahead-of-time compilation of the mapping hot path with mypyc
+# (SMARTFUSION_MYPYC=1, requires mypy); the pure-Python module is used
+# otherwise
+ext_modules = []
+if os.environ.get("SMARTFUSION_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        "--disable-error-code", "annotation-unchecked",
+        "core/fusion_mapper/mapper.py",
+    ])
+
 setup(
     name="phoenix-smartfusionai",
     version="1.0.0",
@@ -17,6 +29,7 @@ setup(
     author_email="",
     url="https://github.com/shaktitrigent/Phoenix-SmartFusionAI",
     packages=find_packages(),
+    ext_modules=ext_modules,
     python_requires=">=3.10",
     install_requires=[
         "pydantic>=2.0.0",
@@ -26,6 +39,7 @@ setup(
     extras_require={
         "playwright": ["playwright>=1.40.0"],
         "selenium": ["selenium>=4.15.0"],
+        "fast": ["orjson>=3.6.0", "google-re2>=1.0", "ijson>=3.1"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -1,5 +1,7 @@
 """Tests for fusion mapper."""
 
+import re
+
 import pytest
 from core.fusion_mapper import FusionMapper
 from core.utils.models import (
@@ -14,21 +16,28 @@ from core.utils.models import (
 )
 
 
+@pytest.fixture(scope="module")
+def playwright_locator_dict():
+    """Login page locators, built once and shared by the read-only mapping tests."""
+    locator_dict = LocatorDictionary()
+    for name, var_name in [("user_name", "self.user_name_input"),
+                           ("password", "self.password_input"),
+                           ("submit", "self.submit_button")]:
+        locator_info = LocatorInfo(
+            variable_name=var_name,
+            locator_expression=f"page.locator('#{name}')",
+            normalized_name=name,
+            locator_type=LocatorType.PLAYWRIGHT
+        )
+        locator_dict.add_locator(name, locator_info)
+    return locator_dict
+
+
 class TestFusionMapper:
     """Test cases for FusionMapper."""
     
-    def test_map_step_with_exact_match(self):
+    def test_map_step_with_exact_match(self, playwright_locator_dict):
         """Test mapping a step with exact locator match."""
-        # Create locator dictionary
-        locator_dict = LocatorDictionary()
-        locator_info = LocatorInfo(
-            variable_name="self.user_name_input",
-            locator_expression="page.locator('#username')",
-            normalized_name="user_name",
-            locator_type=LocatorType.PLAYWRIGHT
-        )
-        locator_dict.add_locator("user_name", locator_info)
-        
         # Create step
         step = BDDStep(
             step_type=StepType.WHEN,
@@ -39,14 +48,14 @@ class TestFusionMapper:
         
         # Map step
         mapper = FusionMapper()
-        enhanced_step, mapping_result = mapper._map_step(step, locator_dict)
+        enhanced_step, mapping_result = mapper._map_step(step, playwright_locator_dict)
         
         assert mapping_result.matched is True
         assert mapping_result.locator_variable == "self.user_name_input"
         assert mapping_result.match_type == "exact"
         assert "${self.user_name_input}" in enhanced_step.text
     
-    def test_map_feature(self):
+    def test_map_feature(self, playwright_locator_dict):
         """Test mapping a complete feature."""
         # Create feature
         feature = BDDFeature(
@@ -84,25 +93,177 @@ class TestFusionMapper:
             ]
         )
         
-        # Create locator dictionary
-        locator_dict = LocatorDictionary()
-        for name, var_name in [("user_name", "self.user_name_input"),
-                               ("password", "self.password_input"),
-                               ("submit", "self.submit_button")]:
-            locator_info = LocatorInfo(
-                variable_name=var_name,
-                locator_expression=f"page.locator('#{name}')",
-                normalized_name=name,
-                locator_type=LocatorType.PLAYWRIGHT
-            )
-            locator_dict.add_locator(name, locator_info)
-        
         # Map feature
         mapper = FusionMapper()
-        enhanced_feature, report = mapper.map_feature(feature, locator_dict)
+        enhanced_feature, report = mapper.map_feature(feature, playwright_locator_dict)
         
         assert enhanced_feature.feature_name == "Login Feature"
         assert len(enhanced_feature.scenarios) == 1
         assert report.matched_steps >= 3  # At least 3 steps should match
         assert report.total_steps == 4
-
+    
+    def test_extract_tokens_preserves_order(self):
+        """Test that extracted tokens are deduplicated in order of appearance."""
+        mapper = FusionMapper()
+        
+        tokens = mapper._extract_tokens_from_step('I enter "Password" into "user_name" and "password"')
+        
+        assert tokens == ["password", "user_name"]
+    
+    def test_extract_tokens_with_several_quoted_values(self, playwright_locator_dict):
+        """Test that every quoted value is a token, alongside keyword matches."""
+        from core.case_engine.generator import BDDGenerator
+        
+        mapper = FusionMapper()
+        
+        assert mapper._extract_tokens_from_step('I enter "john doe" into "username" field') == [
+            "john doe", "username", "john"
+        ]
+        assert mapper._extract_tokens_from_step('I click "Sign in" then "submit"') == [
+            "sign in", "submit", "sign"
+        ]
+        assert BDDGenerator()._extract_tokens('I click "Sign in" then "submit"') == [
+            "sign in", "submit", "sign"
+        ]
+        
+        step = BDDStep(
+            step_type=StepType.WHEN,
+            text='I enter "john doe" into "user_name" field',
+            tokens=["john doe", "user_name", "john"],
+            original_text='When I enter "john doe" into "user_name" field'
+        )
+        _, result = mapper._map_step(step, playwright_locator_dict)
+        assert result.locator_variable == "self.user_name_input"
+    
+    def test_extract_tokens_non_ascii(self):
+        """Test that non-ASCII steps tokenize the same on either regex engine."""
+        from core.fusion_mapper.mapper import _TOKEN_SOURCES, _compile_token_re, _scan_tokens
+        
+        mapper = FusionMapper()
+        stdlib_patterns = tuple(re.compile(p, re.IGNORECASE) for p in _TOKEN_SOURCES)
+        engine_patterns = tuple(_compile_token_re(p) for p in _TOKEN_SOURCES)
+        
+        for step_text, expected in [
+            ("I verify contraseña", ["contraseña"]),
+            ("I click on café", ["café"]),
+            ("I CLICK ON Überweisung", ["überweisung"]),
+            ("I click on submit", ["submit"]),
+        ]:
+            assert mapper._extract_tokens_from_step(step_text) == expected
+            assert list(_scan_tokens(step_text, stdlib_patterns)) == expected
+            if step_text.isascii():
+                assert list(_scan_tokens(step_text, engine_patterns)) == expected
+    
+    def test_extract_tokens_is_memoized(self):
+        """Test that repeated step texts reuse the cached tokenization."""
+        from core.fusion_mapper.mapper import _scan_tokens
+        
+        mapper = FusionMapper()
+        step_text = 'I click on "memoized_submit"'
+        
+        first = mapper._extract_tokens_from_step(step_text)
+        hits_before = _scan_tokens.cache_info().hits
+        second = mapper._extract_tokens_from_step(step_text)
+        
+        assert first == second == ["memoized_submit"]
+        assert _scan_tokens.cache_info().hits == hits_before + 1
+    
+    def test_map_feature_parallel_matches_sequential(self):
+        """Test that mapping scenarios in threads preserves order and stats."""
+        feature = BDDFeature(
+            feature_name="Parallel Feature",
+            scenarios=[
+                BDDScenario(
+                    name=f"Scenario {i}",
+                    steps=[
+                        BDDStep(
+                            step_type=StepType.WHEN,
+                            text=f'I enter "{token}"',
+                            tokens=[token],
+                            original_text=f'When I enter "{token}"'
+                        )
+                    ]
+                )
+                for i, token in enumerate(["user_name", "missing", "password"] * 3)
+            ]
+        )
+        
+        locator_dict = LocatorDictionary()
+        for name in ("user_name", "password"):
+            locator_dict.add_locator(name, LocatorInfo(
+                variable_name=f"self.{name}_input",
+                locator_expression=f"page.locator('#{name}')",
+                normalized_name=name
+            ))
+        
+        sequential = FusionMapper(FusionConfig(enable_partial_matching=False))
+        parallel = FusionMapper(FusionConfig(enable_partial_matching=False, max_workers=4))
+        
+        seq_feature, seq_report = sequential.map_feature(feature, locator_dict)
+        par_feature, par_report = parallel.map_feature(feature, locator_dict)
+        
+        assert par_feature.model_dump() == seq_feature.model_dump()
+        assert par_report.model_dump() == seq_report.model_dump()
+        assert par_report.matched_steps == 6
+        assert par_report.unmatched_tokens == ["missing"]
+        
+        # The fused pass builds the same table as a separate traversal
+        _, _, table = parallel.map_feature_with_table(feature, locator_dict)
+        assert table == sequential.generate_mapping_table(seq_feature, locator_dict)
+    
+    def test_map_step_with_fuzzy_match(self):
+        """Test the opt-in edit-distance fallback for misspelled tokens."""
+        from core.utils.edit_distance import levenshtein
+        
+        assert levenshtein("kitten", "sitting") == 3
+        assert levenshtein("", "abc") == 3
+        
+        locator_dict = LocatorDictionary()
+        for name in ("password", "user_name"):
+            locator_dict.add_locator(name, LocatorInfo(
+                variable_name=f"self.{name}_input",
+                locator_expression=f"page.locator('#{name}')",
+                normalized_name=name
+            ))
+        
+        step = BDDStep(
+            step_type=StepType.WHEN,
+            text='I enter "pasword"',
+            tokens=["pasword"],
+            original_text='When I enter "pasword"'
+        )
+        
+        _, result = FusionMapper()._map_step(step, locator_dict)
+        assert not result.matched
+        
+        mapper = FusionMapper(FusionConfig(fuzzy_max_distance=1))
+        enhanced_step, result = mapper._map_step(step, locator_dict)
+        assert result.match_type == "fuzzy"
+        assert enhanced_step.mapped_locator == "self.password_input"
+    
+    def test_generated_step_patterns_compile(self, playwright_locator_dict):
+        """Test that rewritten steps yield step patterns pytest-bdd can compile."""
+        import re
+        from core.case_engine.generator import BDDGenerator
+        from core.step_definitions.generator import StepDefinitionGenerator
+        
+        feature = BDDGenerator().parse_feature_content(
+            "Feature: Login\n"
+            "  Scenario: Valid login\n"
+            '    When I enter "user_name" with value "Admin"\n'
+            '    And I enter "password" with value "password"\n'
+            '    And I click on "submit"\n'
+        )
+        enhanced_feature, _ = FusionMapper().map_feature(feature, playwright_locator_dict)
+        
+        # A quoted value differing only in case keeps its quotes
+        assert enhanced_feature.scenarios[0].steps[0].text == (
+            'I enter ${self.user_name_input} with value "${self.user_name_input}"'
+        )
+        
+        for framework in (LocatorType.PLAYWRIGHT, LocatorType.SELENIUM):
+            code = StepDefinitionGenerator(framework).generate(enhanced_feature)
+            patterns = re.findall(r'parsers\.re\(r"""(.*?)"""\)', code)
+            assert patterns
+            for pattern in patterns:
+                re.compile(pattern)
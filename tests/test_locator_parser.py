@@ -2,9 +2,10 @@
 
 import pytest
 import json
+import sys
 import tempfile
 from pathlib import Path
-from core.locator_engine import LocatorParser
+from core.locator_engine import LocatorParser, ParseCache
 from core.utils.models import LocatorType
 
 
@@ -12,8 +13,7 @@ class TestLocatorParser:
     """Test cases for LocatorParser."""
     
     def test_parse_locators_json(self):
-        """Test parsing locators.json file."""
-        # Create temporary JSON file
+        """Test parsing locators.json content."""
         locators_data = {
             "user_name": {
                 "variable": "self.user_name_input",
@@ -29,21 +29,140 @@ class TestLocatorParser:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(locators_data, f)
+        parser = LocatorParser(LocatorType.PLAYWRIGHT)
+        dictionary = parser.parse_locators_bytes(json.dumps(locators_data).encode())
+        
+        assert len(dictionary.locators) == 3
+        assert "user_name" in dictionary.locators
+        assert dictionary.locators["user_name"].variable_name == "self.user_name_input"
+        assert dictionary.locators["user_name"].locator_expression == "page.locator('#username')"
+    
+    def test_parse_locators_json_stream(self, monkeypatch):
+        """Test that streamed parsing matches in-memory parsing for both formats."""
+        pytest.importorskip("ijson")
+        from core.locator_engine import parser as parser_module
+        
+        documents = [
+            {"user_name": {"variable": "self.user_name_input", "locator": "page.locator('#username')"},
+             "submit": "page.locator('#submit')"},
+            {"locators": [{"custom_name": "loginButton", "locator_value": "button", "locator_type": "Role"}],
+             "metadata": {}},
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for index, document in enumerate(documents):
+                locator_path = Path(temp_dir) / f"locators{index}.json"
+                locator_path.write_text(json.dumps(document))
+                
+                expected = LocatorParser().parse_locators_json(str(locator_path))
+                monkeypatch.setattr(parser_module, "_JSON_STREAM_THRESHOLD", 0)
+                streamed = LocatorParser().parse_locators_json(str(locator_path))
+                monkeypatch.undo()
+                
+                assert streamed.locators
+                assert streamed.model_dump() == expected.model_dump()
+    
+    def test_parse_page_py(self):
+        """Test parsing locator assignments from a page.py file."""
+        page_source = (
+            "class LoginPage:\n"
+            "    def __init__(self, page):\n"
+            "        self.page = page\n"
+            "        self.user_name_input = page.locator(\"#username\")\n"
+            "        self.submit_button = page.get_by_role(\n"
+            "            'button', name='Login')  # multi-line call\n"
+            "\n"
+            "    def login(self):\n"
+            "        if self.page: self.password_input = page.locator('#password')\n"
+            "        self.user_name_input.fill('admin')\n"
+        )
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            f.write(page_source)
             temp_path = f.name
         
         try:
             parser = LocatorParser(LocatorType.PLAYWRIGHT)
-            dictionary = parser.parse_locators_json(temp_path)
+            dictionary = parser.parse_page_py(temp_path)
             
-            assert len(dictionary.locators) == 3
-            assert "user_name" in dictionary.locators
+            assert list(dictionary.locators) == ["page", "user_name", "submit", "password"]
             assert dictionary.locators["user_name"].variable_name == "self.user_name_input"
-            assert dictionary.locators["user_name"].locator_expression == "page.locator('#username')"
+            assert dictionary.locators["user_name"].locator_expression == 'page.locator("#username")'
+            assert dictionary.locators["password"].locator_expression == "page.locator('#password')"
+            assert dictionary.locators["submit"].locator_expression == (
+                "page.get_by_role('button', name='Login')"
+            )
         finally:
             Path(temp_path).unlink()
     
+    def test_parse_uses_cache(self, monkeypatch):
+        """Test that a cached locator file is not parsed again."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            locator_path = Path(temp_dir) / "locators.json"
+            locator_path.write_text(json.dumps({"user_name": "page.locator('#username')"}))
+            cache = ParseCache(Path(temp_dir) / "parse_cache.db")
+            
+            first = LocatorParser(cache=cache).parse(str(locator_path))
+            
+            def fail(*args, **kwargs):
+                raise AssertionError("cached file was parsed again")
+            
+            monkeypatch.setattr(LocatorParser, "parse_locators_json", fail)
+            second = LocatorParser(cache=cache).parse(str(locator_path))
+            
+            assert second.model_dump() == first.model_dump()
+    
+    def test_cache_drops_entries_that_fail_to_load(self):
+        """Test that an unloadable cache entry is a miss and is removed."""
+        import sqlite3
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ParseCache(Path(temp_dir) / "parse_cache.db")
+            key = ("/locators.json", "digest", LocatorType.PLAYWRIGHT.value)
+            with sqlite3.connect(cache.db_path) as conn:
+                conn.execute(
+                    "CREATE TABLE cache (path TEXT, hash TEXT, locator_type TEXT, blob BLOB, "
+                    "PRIMARY KEY (path, hash, locator_type))"
+                )
+                conn.execute("INSERT INTO cache VALUES (?, ?, ?, ?)", key + (b"cno_such_module\nThing\n)R.",))
+            
+            assert cache.get("/locators.json", "digest", LocatorType.PLAYWRIGHT) is None
+            with sqlite3.connect(cache.db_path) as conn:
+                assert conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] == 0
+    
+    def test_parse_many(self):
+        """Test parsing several locator files into one dictionary."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = Path(temp_dir) / "locators.json"
+            json_path.write_text(json.dumps({"user_name": "page.locator('#username')"}))
+            page_path = Path(temp_dir) / "page.py"
+            page_path.write_text(
+                "class LoginPage:\n"
+                "    def __init__(self, page):\n"
+                "        self.submit_button = page.locator('#submit')\n"
+            )
+            
+            dictionary = LocatorParser.parse_many([str(json_path), str(page_path)], max_workers=2)
+            
+            assert list(dictionary.locators) == ["user_name", "submit"]
+            assert dictionary.locators["submit"].variable_name == "self.submit_button"
+    
+    def test_parse_returns_fresh_dictionary(self):
+        """Test that reusing a parser does not carry over earlier locators."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first_path = Path(temp_dir) / "first.json"
+            first_path.write_text(json.dumps({"user_name": "page.locator('#username')"}))
+            second_path = Path(temp_dir) / "second.json"
+            second_path.write_text(json.dumps({"password": "page.locator('#password')"}))
+            
+            parser = LocatorParser()
+            first = parser.parse(str(first_path))
+            second = parser.parse(str(second_path))
+            
+            assert list(first.locators) == ["user_name"]
+            assert list(second.locators) == ["password"]
+            assert parser.get_dictionary() is second
+    
     def test_normalize_name(self):
         """Test name normalization."""
         parser = LocatorParser()
@@ -51,6 +170,16 @@ class TestLocatorParser:
         assert parser._normalize_name("user_name_input") == "user_name"
         assert parser._normalize_name("submit_button") == "submit"
         assert parser._normalize_name("loginForm") == "login_form"
+        
+        # Results are memoized across parsers and interned
+        from core.locator_engine.parser import _normalize_name_cached
+        
+        _normalize_name_cached.cache_clear()
+        first = parser._normalize_name("loginForm")
+        second = LocatorParser()._normalize_name("loginForm")
+        assert _normalize_name_cached.cache_info().hits == 1
+        assert second is first
+        assert parser._normalize_name("submit_button") is sys.intern("submit")
     
     def test_get_locator(self):
         """Test getting locator from dictionary."""
@@ -71,4 +200,49 @@ class TestLocatorParser:
         assert retrieved.variable_name == "self.user_name_input"
         
         assert dictionary.get_locator("nonexistent") is None
-
+    
+    def test_find_partial_match(self):
+        """Test partial matching in both directions, earliest locator first."""
+        from core.utils.models import LocatorDictionary, LocatorInfo
+        
+        dictionary = LocatorDictionary()
+        for name in ["login_form", "user_name", "name"]:
+            dictionary.add_locator(name, LocatorInfo(
+                variable_name=f"self.{name}",
+                locator_expression=f"page.locator('#{name}')",
+                normalized_name=name
+            ))
+        
+        assert dictionary.find_partial_match("USER") == "user_name"
+        assert dictionary.find_partial_match("first_name") == "name"
+        assert dictionary.find_partial_match("the_user_name_field") == "user_name"
+        assert dictionary.find_partial_match("password") is None
+        
+        # Adding a name invalidates memoized results
+        dictionary.add_locator("password", LocatorInfo(
+            variable_name="self.password",
+            locator_expression="page.locator('#password')",
+            normalized_name="password"
+        ))
+        assert dictionary.find_partial_match("password") == "password"
+    
+    def test_partial_match_index_published_last(self, monkeypatch):
+        """Test that concurrent lookups never see a half-built partial-match index."""
+        from core.utils.models import LocatorDictionary, LocatorInfo
+        
+        dictionary = LocatorDictionary()
+        dictionary.add_locator("user_name", LocatorInfo(
+            variable_name="self.user_name",
+            locator_expression="page.locator('#user_name')",
+            normalized_name="user_name"
+        ))
+        
+        build = LocatorDictionary._build_name_automaton
+        
+        def build_and_check(self):
+            # Another thread would skip indexing if the size were current
+            assert self._trie_size < len(self._names)
+            build(self)
+        
+        monkeypatch.setattr(LocatorDictionary, "_build_name_automaton", build_and_check)
+        assert dictionary.find_partial_match("the_user_name_field") == "user_name"